@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+# Where the kernel exposes DRM cards; overridable so a fake tree can stand in for tests
+SYSFS_DRM_ROOT = '/sys/class/drm'
+
+# hwmon temperature labels in order of preference (junction is what rocm-smi reports)
+TEMPERATURE_LABELS = ('junction', 'edge', 'mem')
+
+BYTES_PER_MB = 1024 * 1024
+
+def find_gpu_cards(root=SYSFS_DRM_ROOT):
+    """Card directories (e.g. /sys/class/drm/card1) whose device reports GPU utilisation"""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    cards = [path for path in root.glob('card[0-9]*')
+             if path.name[4:].isdigit() and (path / 'device' / 'gpu_busy_percent').exists()]
+    return sorted(cards, key=lambda path: int(path.name[4:]))
+
+class GpuDevice:
+    """Static identity of one GPU card, read once at discovery"""
+
+    def __init__(self, card_path):
+        self.card_path = Path(card_path)
+        self.index = int(self.card_path.name[4:])
+        self.device_path = self.card_path / 'device'
+        hwmons = sorted((self.device_path / 'hwmon').glob('hwmon*'))
+        self.hwmon_path = hwmons[0] if hwmons else None
+        self.product_name = _read_text(self.device_path / 'product_name')  # Not exposed by every driver
+        self.pci_device_id = _read_text(self.device_path / 'device')
+        vram_total = _read_text(self.device_path / 'mem_info_vram_total')
+        self.vram_total_mb = round(int(vram_total) / BYTES_PER_MB) if vram_total and vram_total.isdigit() else None
+
+    def to_dict(self):
+        return {
+            'card': self.card_path.name,
+            'index': self.index,
+            'name': self.product_name,
+            'pci_device_id': self.pci_device_id,
+            'hwmon': str(self.hwmon_path) if self.hwmon_path else None,
+            'vram_total_mb': self.vram_total_mb,
+        }
+
+class GpuInventory:
+    """GPU devices discovered once and shared by every GPU reader in the dashboard
+
+    The DRM directory listing is re-checked at most every `check_interval`
+    seconds; only when it changes (hotplug, driver reload) are the devices
+    rediscovered and their readers reopened. Names that sysfs does not
+    provide are resolved through `name_lookup` and cached until rediscovery.
+    """
+
+    def __init__(self, root=SYSFS_DRM_ROOT, name_lookup=None, check_interval=10.0):
+        self.root = root
+        self.check_interval = check_interval
+        self._name_lookup = name_lookup
+        self._lookup_name = None
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._reader = None
+        self.devices = []
+        self._signature = None
+        self._discover()
+
+    @property
+    def primary(self):
+        """The first GPU card, or None"""
+        return self.devices[0] if self.devices else None
+
+    def refresh(self):
+        """Rediscover devices if the card listing changed; returns True when it did"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        with self._lock:
+            self._next_check = now + self.check_interval
+            if self._listing() == self._signature:
+                return False
+            self._discover()
+            return True
+
+    def reader(self):
+        """Shared SysfsGpuReader for the primary card (None without a sysfs GPU)"""
+        self.refresh()
+        with self._lock:
+            if self._reader is None and self.primary is not None:
+                self._reader = SysfsGpuReader(self.primary)
+            return self._reader
+
+    def name(self):
+        """Display name: sysfs product name, else the cached name lookup"""
+        if self.primary is not None and self.primary.product_name:
+            return self.primary.product_name
+        if self._lookup_name is None:
+            self._lookup_name = (self._name_lookup() if self._name_lookup else None) or 'AMD GPU'
+        return self._lookup_name
+
+    def to_dict(self):
+        return {'root': str(self.root), 'devices': [device.to_dict() for device in self.devices]}
+
+    def _listing(self):
+        try:
+            return tuple(sorted(os.listdir(self.root)))
+        except OSError:
+            return ()
+
+    def _discover(self):
+        # Swap first, then close: close() waits for reads still using the old reader
+        old_reader, self._reader = self._reader, None
+        self._signature = self._listing()
+        self.devices = [GpuDevice(card) for card in find_gpu_cards(self.root)]
+        self._lookup_name = None  # The looked-up name may belong to a card that is gone
+        if old_reader is not None:
+            old_reader.close()
+
+class SysfsGpuReader:
+    """Reads AMD GPU metrics straight from sysfs/hwmon without spawning rocm-smi
+
+    Every metric file is opened once and re-read with os.pread, so a sample is
+    a handful of small reads with no process startup or path lookups. Reads
+    and close() are serialized, so a descriptor is never closed (and its
+    number reused) while a read is in progress; a closed reader reports no
+    metrics.
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self._fds = {}
+        self._lock = threading.Lock()
+
+        self._open('busy', device.device_path / 'gpu_busy_percent')
+        self._open('vram_used', device.device_path / 'mem_info_vram_used')
+        hwmon = device.hwmon_path
+        if hwmon is not None:
+            temperature = _find_temperature_input(hwmon)
+            if temperature is not None:
+                self._open('temperature', temperature)
+            self._open('pwm', hwmon / 'pwm1')
+            self._open('pwm_max', hwmon / 'pwm1_max')
+            self._open('fan_rpm', hwmon / 'fan1_input')
+            # Newer kernels only provide power1_input
+            if not self._open('power', hwmon / 'power1_average'):
+                self._open('power', hwmon / 'power1_input')
+
+    def read(self):
+        """Current metrics in the shape of system.get_gpu_info (name is left to the inventory)"""
+        with self._lock:
+            return self._read()
+
+    def _read(self):
+        busy = self._read_int('busy')
+        vram_used = self._read_int('vram_used')
+        vram_total = self.device.vram_total_mb
+        temperature = self._read_int('temperature')
+        pwm = self._read_int('pwm')
+        pwm_max = self._read_int('pwm_max') or 255
+        power = self._read_int('power')
+
+        vram_used_mb = round(vram_used / BYTES_PER_MB) if vram_used is not None else None
+        vram_percent = None
+        if vram_used_mb is not None and vram_total:
+            vram_percent = round(vram_used_mb * 100 / vram_total)
+
+        return {
+            'available': busy is not None,
+            'card': self.device.card_path.name,
+            'temperature': temperature / 1000 if temperature is not None else None,  # millidegrees C
+            'usage': busy,
+            'vram_used': vram_used_mb,
+            'vram_total': vram_total,
+            'vram_percent': vram_percent,
+            'fan_speed': round(pwm * 100 / pwm_max) if pwm is not None else None,
+            'fan_rpm': self._read_int('fan_rpm'),
+            'power': power / 1000000 if power is not None else None,  # microwatts
+        }
+
+    def close(self):
+        """Close every pre-opened file descriptor, once in-flight reads have finished"""
+        with self._lock:
+            for fd in self._fds.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._fds = {}
+
+    def _open(self, key, path):
+        try:
+            self._fds[key] = os.open(path, os.O_RDONLY)
+            return True
+        except OSError:
+            return False
+
+    def _read_int(self, key):
+        fd = self._fds.get(key)
+        if fd is None:
+            return None
+        try:
+            return int(os.pread(fd, 32, 0))
+        except (OSError, ValueError):
+            return None  # e.g. EBUSY while the GPU is suspended
+
+def _find_temperature_input(hwmon_path):
+    """temp*_input matching the preferred label, else temp1_input"""
+    labels = {}
+    for label_path in hwmon_path.glob('temp*_label'):
+        label = _read_text(label_path)
+        if label:
+            labels[label.lower()] = label_path.name.replace('_label', '_input')
+    for label in TEMPERATURE_LABELS:
+        if label in labels:
+            return hwmon_path / labels[label]
+    fallback = hwmon_path / 'temp1_input'
+    return fallback if fallback.exists() else None
+
+def _read_text(path):
+    """Stripped file contents, or None if unreadable or empty"""
+    try:
+        return path.read_text().strip() or None
+    except OSError:
+        return None
@@ -3,8 +3,12 @@ import re
 import os
 import subprocess
 import glob
+import threading
 from pathlib import Path
 
+from .singleflight import coalesced
+
+@coalesced
 def get_logs_info(dashboard):
     """Get information about log files from multiple sources"""
     logs_info = {
@@ -79,7 +83,7 @@ def _get_dashboard_logs(dashboard):
                 'size_bytes': stat.st_size,
                 'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
                 'modified_timestamp': stat.st_mtime,
-                'lines': _count_lines(log_file),
+                'lines': _count_lines(log_file, stat),
                 'category': category,
                 'source': 'dashboard',
                 'readable': True
@@ -170,7 +174,7 @@ def _get_system_logs():
                     'size_bytes': stat.st_size,
                     'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
                     'modified_timestamp': stat.st_mtime,
-                    'lines': _count_lines(Path(log_path)),
+                    'lines': _count_lines(log_path, stat),
                     'category': category,
                     'source': 'system',
                     'readable': True
@@ -273,8 +277,9 @@ def _rotate_dashboard_logs(logs_path):
     except Exception as e:
         print(f"Log rotation failed: {e}")
 
-def get_log_content(dashboard, log_identifier, lines=100, filter_level=None, search_term=None):
-    """Get content of a specific log file or journal"""
+@coalesced
+def get_log_content(dashboard, log_identifier, lines=100, filter_level=None, search_term=None, after=None):
+    """Get content of a specific log file or journal (journal: only entries after the `after` cursor, if given)"""
     log_content = {
         'timestamp': datetime.now().isoformat(),
         'log_name': log_identifier,
@@ -287,7 +292,7 @@ def get_log_content(dashboard, log_identifier, lines=100, filter_level=None, sea
     try:
         if log_identifier.startswith('journal:'):
             # Handle systemd journal
-            log_content = _get_journal_content(log_identifier, lines, filter_level, search_term)
+            log_content = _get_journal_content(log_identifier, lines, filter_level, search_term, after)
         else:
             # Handle regular log files
             log_content = _get_file_content(dashboard, log_identifier, lines, filter_level, search_term)
@@ -297,27 +302,60 @@ def get_log_content(dashboard, log_identifier, lines=100, filter_level=None, sea
     
     return log_content
 
-def _get_journal_content(journal_identifier, lines=100, filter_level=None, search_term=None):
-    """Get content from systemd journal"""
+# Syslog priorities of journal entries, grouped like the content filter (5/notice counts as OTHER)
+JOURNAL_PRIORITY_LEVELS = {'0': 'ERROR', '1': 'ERROR', '2': 'ERROR', '3': 'ERROR',
+                           '4': 'WARNING', '6': 'INFO', '7': 'DEBUG'}
+JOURNAL_PRIORITY_PATTERN = re.compile(rb'"PRIORITY"\s*:\s*"(\d)"')  # Spacing differs between systemd versions
+
+# Trailer line journalctl --show-cursor prints after the entries
+JOURNAL_CURSOR_PREFIX = '-- cursor: '
+
+# Entries the journal histogram covers when no time window is given
+JOURNAL_STATS_ENTRIES = 1000
+JOURNAL_STATS_TIMEOUT = 10
+
+JOURNAL_SINCE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+def _journal_boot_args(journal_identifier):
+    """journalctl arguments selecting the boot of a journal identifier"""
+    if journal_identifier == 'journal:current':
+        return ['-b']  # Current boot
+    if journal_identifier.startswith('journal:') and journal_identifier != 'journal:unavailable':
+        boot_id = journal_identifier.split(':', 1)[1]
+        if boot_id != 'current':
+            return ['-b', boot_id]
+    return []
+
+def _journal_since_arg(since):
+    """--since argument for a window like '90s', '15m', '6h' or '2d'"""
+    match = re.fullmatch(r'(\d+)([smhd])', since.strip().lower())
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Invalid window '{since}', expected e.g. 15m, 6h or 2d")
+    return f"--since=-{int(match.group(1)) * JOURNAL_SINCE_UNITS[match.group(2)]}s"
+
+def _get_journal_content(journal_identifier, lines=100, filter_level=None, search_term=None, after=None):
+    """Get content from systemd journal
+
+    The response carries the journal cursor of the last entry read. Passing
+    it back as `after` returns only newer entries (at most `lines`, oldest
+    first), so a live view costs as much as the entries that arrived.
+    """
     log_content = {
         'timestamp': datetime.now().isoformat(),
         'log_name': journal_identifier,
         'lines': [],
         'total_lines': 0,
         'filtered_lines': 0,
+        'cursor': after,
         'error': None
     }
     
     try:
         # Build journalctl command
-        cmd = ['journalctl', '--no-pager', '-n', str(lines)]
-        
-        if journal_identifier == 'journal:current':
-            cmd.extend(['-b'])  # Current boot
-        elif journal_identifier.startswith('journal:') and journal_identifier != 'journal:unavailable':
-            boot_id = journal_identifier.split(':', 1)[1]
-            if boot_id != 'current':
-                cmd.extend(['-b', boot_id])
+        cmd = ['journalctl', '--no-pager', '--show-cursor', '-n', str(lines)]
+        if after:
+            cmd.extend(['--quiet', f'--after-cursor={after}'])  # --quiet drops "-- No entries --"
+        cmd.extend(_journal_boot_args(journal_identifier))
         
         # Add priority filter if specified
         if filter_level and filter_level.upper() != 'ALL':
@@ -334,7 +372,9 @@ def _get_journal_content(journal_identifier, lines=100, filter_level=None, searc
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0:
-            all_lines = result.stdout.strip().split('\n')
+            all_lines = result.stdout.splitlines()
+            if all_lines and all_lines[-1].startswith(JOURNAL_CURSOR_PREFIX):
+                log_content['cursor'] = all_lines.pop()[len(JOURNAL_CURSOR_PREFIX):]
             log_content['total_lines'] = len(all_lines)
             
             # Apply search filter
@@ -357,12 +397,11 @@ def _get_journal_content(journal_identifier, lines=100, filter_level=None, searc
     return log_content
 
 def _get_file_content(dashboard, log_name, lines=100, filter_level=None, search_term=None):
-    """Get content from a regular log file"""
+    """Get content from a regular log file (the file's line count is served by get_log_stats)"""
     log_content = {
         'timestamp': datetime.now().isoformat(),
         'log_name': log_name,
         'lines': [],
-        'total_lines': 0,
         'filtered_lines': 0,
         'error': None
     }
@@ -382,63 +421,119 @@ def _get_file_content(dashboard, log_name, lines=100, filter_level=None, search_
         return log_content
     
     try:
-        # Read the file
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            all_lines = f.readlines()
-        
-        log_content['total_lines'] = len(all_lines)
-        
-        # Apply filters
-        filtered_lines = []
-        for line in all_lines:
-            line_stripped = line.strip()
-            
-            # Skip empty lines
-            if not line_stripped:
-                continue
-            
-            # Filter by log level
-            if filter_level and filter_level.upper() not in ['ALL', 'ANY']:
-                line_upper = line_stripped.upper()
-                level_found = False
-                
-                if filter_level.upper() == 'ERROR':
-                    # Look for error indicators
-                    if any(keyword in line_upper for keyword in ['ERROR', 'CRITICAL', 'FATAL', 'FAIL']):
-                        level_found = True
-                elif filter_level.upper() == 'WARNING':
-                    # Look for warning indicators
-                    if any(keyword in line_upper for keyword in ['WARNING', 'WARN', 'CAUTION']):
-                        level_found = True
-                elif filter_level.upper() == 'INFO':
-                    # Look for info indicators
-                    if any(keyword in line_upper for keyword in ['INFO', 'INFORMATION', 'NOTICE']):
-                        level_found = True
-                elif filter_level.upper() == 'DEBUG':
-                    # Look for debug indicators
-                    if any(keyword in line_upper for keyword in ['DEBUG', 'TRACE', 'VERBOSE']):
-                        level_found = True
-                
-                # If no level found and we're filtering, skip this line
-                if not level_found:
-                    continue
-            
-            # Search filter
-            if search_term:
-                if search_term.lower() not in line_stripped.lower():
-                    continue
-            
-            filtered_lines.append(line_stripped)
-        
-        log_content['filtered_lines'] = len(filtered_lines)
-        log_content['lines'] = filtered_lines[-lines:] if lines > 0 else filtered_lines
+        matched, truncated = _tail_matching_lines(log_path, lines, filter_level, search_term)
+        log_content['filtered_lines'] = len(matched)
+        log_content['lines'] = matched
+        log_content['truncated'] = truncated  # Fewer matches than requested within TAIL_MAX_SCAN_BYTES
         
     except Exception as e:
         log_content['error'] = str(e)
     
     return log_content
 
-def get_log_stats(dashboard, log_identifier):
+# Level filter keywords, matched case-insensitively anywhere in the line
+LEVEL_KEYWORDS = {
+    'ERROR': ['ERROR', 'CRITICAL', 'FATAL', 'FAIL'],
+    'WARNING': ['WARNING', 'WARN', 'CAUTION'],
+    'INFO': ['INFO', 'INFORMATION', 'NOTICE'],
+    'DEBUG': ['DEBUG', 'TRACE', 'VERBOSE'],
+}
+
+# Tail reader: block size, bytes scanned at most when matches are rare, longest line kept
+TAIL_BLOCK_SIZE = 64 * 1024
+TAIL_MAX_SCAN_BYTES = 64 * 1024 * 1024
+TAIL_MAX_LINE_BYTES = 64 * 1024
+
+# Prefix of a line cut to its last TAIL_MAX_LINE_BYTES
+TAIL_TRUNCATED_MARKER = '…[truncated] '
+
+def _line_matches(line, filter_level=None, search_term=None):
+    """Whether a stripped, non-empty line passes the level and search filters"""
+    if filter_level and filter_level.upper() not in ['ALL', 'ANY']:
+        keywords = LEVEL_KEYWORDS.get(filter_level.upper())
+        line_upper = line.upper()
+        if not keywords or not any(keyword in line_upper for keyword in keywords):
+            return False
+    if search_term and search_term.lower() not in line.lower():
+        return False
+    return True
+
+def _tail_matching_lines(log_path, lines=100, filter_level=None, search_term=None):
+    """Last `lines` non-empty lines passing the filters, read backwards from the end of the file
+
+    The file is read in TAIL_BLOCK_SIZE blocks from EOF towards the start and
+    filtered as it goes, stopping as soon as enough lines matched. Memory is
+    bounded by one block, one partial line and the lines kept; a line longer
+    than TAIL_MAX_LINE_BYTES keeps only its last TAIL_MAX_LINE_BYTES, prefixed
+    with TAIL_TRUNCATED_MARKER. When matches are rare at most
+    TAIL_MAX_SCAN_BYTES are read. Returns (lines oldest first, whether that
+    limit cut the scan short).
+    """
+    wanted = lines if lines > 0 else None
+    matched = []  # Newest first
+    needles = _block_needles(filter_level, search_term)
+    
+    with open(log_path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        scan_start = max(0, position - TAIL_MAX_SCAN_BYTES)
+        partial = b''
+        overlong = False  # partial is the cut end of a line longer than TAIL_MAX_LINE_BYTES
+        while position > scan_start:
+            size = min(TAIL_BLOCK_SIZE, position - scan_start)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            if overlong:
+                newline = block.rfind(b'\n')
+                if newline < 0:
+                    continue  # Still inside the overlong line: skip to its start
+                if _keep_line(partial, matched, filter_level, search_term, True) and len(matched) == wanted:
+                    return matched[::-1], False
+                block, partial, overlong = block[:newline + 1], b'', False
+            block += partial
+            pieces = block.split(b'\n')
+            # The first piece may continue in the previous block (unless this is the start of the file)
+            partial = pieces[0]
+            if len(partial) > TAIL_MAX_LINE_BYTES:
+                partial, overlong = partial[-TAIL_MAX_LINE_BYTES:], True
+            if needles and not _block_may_match(block, needles):
+                continue  # No line in this block can pass the filters
+            for raw in reversed(pieces[1:]):
+                if _keep_line(raw, matched, filter_level, search_term) and len(matched) == wanted:
+                    return matched[::-1], False
+        
+        if scan_start == 0:
+            _keep_line(partial, matched, filter_level, search_term, overlong)
+    
+    return matched[::-1], scan_start > 0
+
+def _block_needles(filter_level=None, search_term=None):
+    """Upper-cased byte strings a block must contain (any one per group) to hold a matching line"""
+    groups = []
+    if filter_level and filter_level.upper() not in ['ALL', 'ANY']:
+        keywords = LEVEL_KEYWORDS.get(filter_level.upper(), [])
+        groups.append([keyword.encode() for keyword in keywords])
+    if search_term and search_term.isascii():
+        groups.append([search_term.upper().encode()])  # bytes.upper() only folds ASCII
+    return groups
+
+def _block_may_match(block, needles):
+    """Cheap pre-check of a whole block before decoding and filtering it line by line"""
+    haystack = block.upper()
+    return all(any(needle in haystack for needle in group) for group in needles)
+
+def _keep_line(raw, matched, filter_level, search_term, truncated=False):
+    """Append a raw line to `matched` if it is non-empty and passes the filters"""
+    if len(raw) > TAIL_MAX_LINE_BYTES:
+        raw, truncated = raw[-TAIL_MAX_LINE_BYTES:], True
+    line = raw.decode('utf-8', errors='ignore').strip()
+    if line and _line_matches(line, filter_level, search_term):
+        matched.append(TAIL_TRUNCATED_MARKER + line if truncated else line)
+        return True
+    return False
+
+@coalesced
+def get_log_stats(dashboard, log_identifier, since=None):
     """Get detailed statistics for a specific log file or journal"""
     stats = {
         'timestamp': datetime.now().isoformat(),
@@ -452,7 +547,7 @@ def get_log_stats(dashboard, log_identifier):
     
     try:
         if log_identifier.startswith('journal:'):
-            stats = _get_journal_stats(log_identifier)
+            stats = _get_journal_stats(log_identifier, since)
         else:
             stats = _get_file_stats(dashboard, log_identifier)
     except Exception as e:
@@ -460,8 +555,14 @@ def get_log_stats(dashboard, log_identifier):
     
     return stats
 
-def _get_journal_stats(journal_identifier):
-    """Get statistics for systemd journal"""
+def _get_journal_stats(journal_identifier, since=None):
+    """Get statistics for systemd journal from a single journalctl pass
+
+    Only the PRIORITY field of each entry is requested (JSON output) and the
+    output is streamed, so the histogram costs one process however many
+    levels are counted. Covers the last JOURNAL_STATS_ENTRIES entries, or
+    the given window (e.g. '1h') when `since` is set.
+    """
     stats = {
         'timestamp': datetime.now().isoformat(),
         'log_name': journal_identifier,
@@ -469,66 +570,60 @@ def _get_journal_stats(journal_identifier):
         'total_lines': 0,
         'last_modified': 'Real-time',
         'log_levels': {},
+        'priorities': {},
+        'window': since or f'last {JOURNAL_STATS_ENTRIES} entries',
         'error': None
     }
     
     try:
-        # Get journal statistics
-        cmd = ['journalctl', '--no-pager', '-n', '1000']
+        cmd = ['journalctl', '--no-pager', '--quiet', '-o', 'json', '--output-fields=PRIORITY']
+        cmd.extend(_journal_boot_args(journal_identifier))
+        cmd.extend([_journal_since_arg(since)] if since else ['-n', str(JOURNAL_STATS_ENTRIES)])
         
-        if journal_identifier == 'journal:current':
-            cmd.extend(['-b'])
-        elif journal_identifier.startswith('journal:') and journal_identifier != 'journal:unavailable':
-            boot_id = journal_identifier.split(':', 1)[1]
-            if boot_id != 'current':
-                cmd.extend(['-b', boot_id])
+        log_levels = {'ERROR': 0, 'WARNING': 0, 'INFO': 0, 'DEBUG': 0, 'OTHER': 0}
+        priorities = {}
+        total = 0
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # stderr is drained alongside stdout so a flood of warnings cannot fill its pipe and stall journalctl
+        stderr_chunks = []
+        drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+        drain.start()
+        timed_out = threading.Event()
         
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            stats['total_lines'] = len(lines)
-            
-            # Count log levels using systemd priority system (same as content filtering)
-            log_levels = {'ERROR': 0, 'WARNING': 0, 'INFO': 0, 'DEBUG': 0, 'OTHER': 0}
-            
-            # Count each level using journalctl priority filters for accuracy
-            priority_map = {
-                'ERROR': '0..3',    # emerg, alert, crit, err
-                'WARNING': '4',     # warning  
-                'INFO': '6',        # info
-                'DEBUG': '7'        # debug
-            }
-            
-            base_cmd = ['journalctl', '--no-pager', '-n', '1000', '--quiet']
-            if journal_identifier == 'journal:current':
-                base_cmd.extend(['-b'])
-            elif journal_identifier.startswith('journal:') and journal_identifier != 'journal:unavailable':
-                boot_id = journal_identifier.split(':', 1)[1]
-                if boot_id != 'current':
-                    base_cmd.extend(['-b', boot_id])
-            
-            # Count each priority level
-            for level, priority in priority_map.items():
-                try:
-                    count_cmd = base_cmd + ['-p', priority]
-                    count_result = subprocess.run(count_cmd, capture_output=True, text=True, timeout=5)
-                    if count_result.returncode == 0:
-                        count_lines = count_result.stdout.strip().split('\n')
-                        # Filter out empty lines
-                        count_lines = [line for line in count_lines if line.strip()]
-                        log_levels[level] = len(count_lines)
-                except:
-                    log_levels[level] = 0
-            
-            # Calculate OTHER as total minus categorized
-            categorized = sum(log_levels[level] for level in ['ERROR', 'WARNING', 'INFO', 'DEBUG'])
-            log_levels['OTHER'] = max(0, stats['total_lines'] - categorized)
-            
-            stats['log_levels'] = log_levels
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(JOURNAL_STATS_TIMEOUT, kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                total += 1
+                match = JOURNAL_PRIORITY_PATTERN.search(line)
+                priority = match.group(1).decode() if match else None
+                if priority is not None:
+                    priorities[priority] = priorities.get(priority, 0) + 1
+                log_levels[JOURNAL_PRIORITY_LEVELS.get(priority, 'OTHER')] += 1
+            returncode = proc.wait()
+            drain.join(JOURNAL_STATS_TIMEOUT)
+        finally:
+            timer.cancel()
+        stderr_lines = b''.join(stderr_chunks).decode(errors='replace').strip().splitlines()
+        
+        if timed_out.is_set():
+            stats['error'] = "journalctl command timed out"
+        elif returncode < 0:
+            stats['error'] = f"journalctl was killed by signal {-returncode}"
+        elif returncode != 0:
+            stats['error'] = f"journalctl failed: {stderr_lines[-1] if stderr_lines else f'exit status {returncode}'}"
         else:
-            stats['error'] = f"journalctl failed: {result.stderr}"
+            stats['total_lines'] = total
+            stats['log_levels'] = log_levels
+            stats['priorities'] = dict(sorted(priorities.items()))
             
+    except FileNotFoundError:
+        stats['error'] = "journalctl not available"
     except Exception as e:
         stats['error'] = str(e)
     
@@ -596,10 +691,75 @@ def _get_file_stats(dashboard, log_name):
     
     return stats
 
-def _count_lines(file_path):
-    """Count lines in a file efficiently"""
+# Chunk size for counting newlines, and the number of files whose counts are cached
+LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+LINE_COUNT_CACHE_SIZE = 512
+
+class LineCountCache:
+    """Line counts per file, keyed by (device, inode, size, mtime)
+
+    An unchanged file is answered from the cache without being opened. A file
+    that only grew (same inode, larger size) has just the appended bytes
+    counted; a replaced, truncated or rewritten file is counted again. Counting
+    uses bytes.count(b'\\n') over large chunks rather than iterating lines.
+    """
+
+    def __init__(self, max_entries=LINE_COUNT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = {}  # path -> (device, inode, size, mtime_ns, newlines, ends_with_newline)
+        self._lock = threading.Lock()
+
+    def count(self, file_path, stat=None):
+        """Number of lines in a file, counting a final line without a trailing newline"""
+        path = str(file_path)
+        stat = stat or os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+
+        if entry is not None and entry[:2] == (stat.st_dev, stat.st_ino):
+            if entry[2:4] == (stat.st_size, stat.st_mtime_ns):
+                return _lines_from(entry[4], entry[5])
+            if stat.st_size > entry[2]:
+                newlines, ends_with_newline, counted = _count_newlines(path, stat.st_size, entry[2],
+                                                                       entry[4], entry[5])
+            else:
+                newlines, ends_with_newline, counted = _count_newlines(path, stat.st_size)
+        else:
+            newlines, ends_with_newline, counted = _count_newlines(path, stat.st_size)
+
+        # Cache the size actually counted: bytes appended after the stat are left for the next call
+        with self._lock:
+            if path not in self._entries and len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[path] = (stat.st_dev, stat.st_ino, counted, stat.st_mtime_ns,
+                                   newlines, ends_with_newline)
+        return _lines_from(newlines, ends_with_newline)
+
+def _count_newlines(path, end, offset=0, newlines=0, ends_with_newline=True):
+    """Newlines between `offset` and `end`, added to a previous count
+
+    Returns (newline count, whether the last byte is a newline, offset reached),
+    the offset being short of `end` only if the file shrank meanwhile.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while offset < end:
+            chunk = f.read(min(LINE_COUNT_CHUNK_SIZE, end - offset))
+            if not chunk:
+                break
+            offset += len(chunk)
+            newlines += chunk.count(b'\n')
+            ends_with_newline = chunk.endswith(b'\n')
+    return newlines, ends_with_newline, offset
+
+def _lines_from(newlines, ends_with_newline):
+    return newlines if ends_with_newline else newlines + 1
+
+line_counts = LineCountCache()
+
+def _count_lines(file_path, stat=None):
+    """Count lines in a file (cached, see LineCountCache)"""
     try:
-        with open(file_path, 'rb') as f:
-            return sum(1 for _ in f)
-    except:
-        return 0 
\ No newline at end of file
+        return line_counts.count(file_path, stat)
+    except OSError:
+        return 0
@@ -0,0 +1,73 @@
+import os
+
+PROC_ROOT = '/proc'
+
+# Socket tables counted for the connection histogram (what psutil.net_connections() calls 'inet')
+SOCKET_TABLES = ('tcp', 'tcp6', 'udp', 'udp6')
+
+# Hex `st` column of /proc/net/tcp*, named as psutil names them
+TCP_STATES = {
+    '01': 'ESTABLISHED', '02': 'SYN_SENT', '03': 'SYN_RECV', '04': 'FIN_WAIT1',
+    '05': 'FIN_WAIT2', '06': 'TIME_WAIT', '07': 'CLOSE', '08': 'CLOSE_WAIT',
+    '09': 'LAST_ACK', '0A': 'LISTEN', '0B': 'CLOSING', '0C': 'NEW_SYN_RECV',
+}
+
+# Columns of /proc/net/dev after the interface name
+DEV_FIELDS = {
+    'bytes_recv': 0, 'packets_recv': 1, 'errors_in': 2, 'drops_in': 3,
+    'bytes_sent': 8, 'packets_sent': 9, 'errors_out': 10, 'drops_out': 11,
+}
+
+# Counters turned into per-second rates between two readings
+RATE_FIELDS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv')
+
+def read_connection_states(proc_root=PROC_ROOT):
+    """Socket count per state from /proc/net, or None without a readable /proc/net
+
+    Only the state column of each table is read, so unlike
+    psutil.net_connections() no process file descriptors are walked and no
+    privileges are needed. UDP sockets have no state and count as NONE.
+    """
+    summary = {}
+    found = False
+    for table in SOCKET_TABLES:
+        try:
+            with open(os.path.join(proc_root, 'net', table), 'rb') as f:
+                lines = f.read().splitlines()[1:]  # Skip header
+        except OSError:
+            continue  # e.g. no IPv6
+        found = True
+        if table.startswith('udp'):
+            if lines:
+                summary['NONE'] = summary.get('NONE', 0) + len(lines)
+            continue
+        for line in lines:
+            state = TCP_STATES.get(line.split(None, 4)[3].decode(), 'UNKNOWN')
+            summary[state] = summary.get(state, 0) + 1
+    return summary if found else None
+
+def read_interface_counters(proc_root=PROC_ROOT):
+    """Cumulative counters per interface (loopback excluded) from /proc/net/dev"""
+    interfaces = {}
+    with open(os.path.join(proc_root, 'net', 'dev'), 'r') as f:
+        lines = f.readlines()[2:]  # Skip header lines
+    for line in lines:
+        name, _, counters = line.partition(':')
+        name = name.strip()
+        if name == 'lo':  # Skip loopback
+            continue
+        values = counters.split()
+        interfaces[name] = {field: int(values[column]) for field, column in DEV_FIELDS.items()}
+    return interfaces
+
+def add_interface_rates(interfaces, previous, elapsed):
+    """Add <counter>_rate (per second) to each interface from the previous reading
+
+    Rates are None on the first reading, for new interfaces and when a
+    counter went backwards (interface reset).
+    """
+    for name, stats in interfaces.items():
+        before = previous.get(name) if previous and elapsed and elapsed > 0 else None
+        for field in RATE_FIELDS:
+            delta = stats[field] - before[field] if before is not None else -1
+            stats[f'{field}_rate'] = round(delta / elapsed, 1) if delta >= 0 else None
@@ -1,5 +1,8 @@
 from datetime import datetime
 
+from .singleflight import coalesced
+
+@coalesced
 def get_scripts_info(dashboard):
     """Get information about available scripts"""
     scripts_info = {
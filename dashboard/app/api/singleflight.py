@@ -0,0 +1,83 @@
+import functools
+import threading
+
+class _Call:
+    """An in-flight computation that concurrent callers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Runs at most one computation per key at a time
+
+    Callers that arrive while a computation for the same key is running wait
+    for it and receive the same result (or exception) instead of starting
+    their own. Results are shared between callers and must be treated as
+    read-only. Per-name counters record how many calls were coalesced.
+    """
+
+    def __init__(self):
+        self._calls = {}  # key -> _Call
+        self._stats = {}  # name -> {'calls', 'executions', 'coalesced'}
+        self._lock = threading.Lock()
+
+    def do(self, name, key, fn, *args, **kwargs):
+        """Call fn(*args, **kwargs) unless an identical call (same name and key) is already running"""
+        flight_key = (name, key)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {'calls': 0, 'executions': 0, 'coalesced': 0}
+            stats['calls'] += 1
+            call = self._calls.get(flight_key)
+            leader = call is None
+            if leader:
+                call = self._calls[flight_key] = _Call()
+                stats['executions'] += 1
+            else:
+                stats['coalesced'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight_key]
+            call.done.set()
+
+    def stats(self):
+        """Copy of the per-name counters plus the number of calls currently in flight"""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'functions': {name: dict(stats) for name, stats in self._stats.items()},
+            }
+
+# Shared by every collector in app/api
+collectors = SingleFlight()
+
+def coalesced(fn):
+    """Decorator: concurrent calls with equal arguments share one execution of fn"""
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)  # Unhashable arguments cannot be matched up
+        return collectors.do(name, key, fn, *args, **kwargs)
+
+    return wrapper
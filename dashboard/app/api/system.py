@@ -3,7 +3,15 @@ import subprocess
 import re
 from datetime import datetime, timedelta
 import json
+import time
 
+from .netstat import add_interface_rates, read_connection_states, read_interface_counters
+from .singleflight import coalesced
+
+# Per-state columns of the cpu lines in /proc/stat (guest time is already counted in user/nice)
+CPU_STATES = ('user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal')
+
+@coalesced
 def get_system_info(dashboard):
     """Get current system information"""
     info = {
@@ -11,10 +19,13 @@ def get_system_info(dashboard):
         'uptime': _get_uptime(),
         'load_average': _get_load_average(),
     }
+    info.update(_get_cpu_usage(dashboard))
     
     if dashboard.has_psutil:
+        if info['cpu_usage'] is None:
+            # No /proc/stat; psutil diffs against its own previous call without sleeping
+            info['cpu_usage'] = dashboard.psutil.cpu_percent(interval=None)
         info.update({
-            'cpu_usage': dashboard.psutil.cpu_percent(interval=1),
             'memory': dashboard.psutil.virtual_memory()._asdict(),
             'disk': dashboard.psutil.disk_usage('/')._asdict(),
             'processes': len(dashboard.psutil.pids())
@@ -25,8 +36,9 @@ def get_system_info(dashboard):
     
     return info
 
+@coalesced
 def get_gpu_info(dashboard):
-    """Get GPU information from rocm-smi"""
+    """Get GPU information from sysfs, falling back to rocm-smi"""
     gpu_info = {
         'timestamp': datetime.now().isoformat(),
         'available': False,
@@ -40,9 +52,18 @@ def get_gpu_info(dashboard):
         'power': None
     }
 
+    # Native path: a few preads on already open sysfs files of the shared inventory
+    inventory = dashboard.gpu_inventory
+    reader = inventory.reader()
+    if reader is not None:
+        gpu_info.update(reader.read())
+        gpu_info['name'] = inventory.name()
+        return gpu_info
+
     try:
         # Get GPU metrics
-        result = subprocess.run(['rocm-smi', '--showtemp', '--showuse', '--showmemuse', '--showfan', '--showpower', '--json'],
+        result = subprocess.run(['rocm-smi', '--showtemp', '--showuse', '--showmemuse', '--showmeminfo', 'vram',
+                                 '--showfan', '--showpower', '--json'],
                               capture_output=True, text=True, timeout=5)
 
         if result.returncode == 0:
@@ -53,16 +74,7 @@ def get_gpu_info(dashboard):
 
             gpu_info['available'] = True
             
-            # Get GPU name separately
-            try:
-                name_result = subprocess.run(['rocm-smi', '--showproductname', '--json'],
-                                           capture_output=True, text=True, timeout=5)
-                if name_result.returncode == 0:
-                    name_data = json.loads(name_result.stdout)
-                    card_name_data = name_data[card_id]
-                    gpu_info['name'] = card_name_data.get('Card Series', 'Unknown GPU')
-            except:
-                gpu_info['name'] = 'AMD GPU'
+            gpu_info['name'] = inventory.name()
 
             # Temperature (using junction temp as it's typically the most relevant)
             temp_str = card_data.get('Temperature (Sensor junction) (C)', card_data.get('Temperature (Sensor edge) (C)', '0.0'))
@@ -72,14 +84,14 @@ def get_gpu_info(dashboard):
             usage_str = card_data.get('GPU use (%)', '0')
             gpu_info['usage'] = int(usage_str) if usage_str else 0
 
-            # VRAM - rocm-smi gives us percentage, we need to calculate MB
+            # VRAM
             vram_percent_str = card_data.get('GPU Memory Allocated (VRAM%)', '0')
             gpu_info['vram_percent'] = int(vram_percent_str) if vram_percent_str else 0
-            
-            # For VRAM total/used, we need to get it from a different command or estimate
-            # For now, we'll show percentage and note that total/used need additional info
-            gpu_info['vram_used'] = gpu_info['vram_percent']  # Just show percentage for now
-            gpu_info['vram_total'] = 100  # Will show as percentage
+            vram_total_str = card_data.get('VRAM Total Memory (B)')
+            vram_used_str = card_data.get('VRAM Total Used Memory (B)')
+            if vram_total_str and vram_used_str:
+                gpu_info['vram_total'] = round(int(vram_total_str) / 1024 / 1024)
+                gpu_info['vram_used'] = round(int(vram_used_str) / 1024 / 1024)
 
             # Fan Speed
             fan_str = card_data.get('Fan speed (%)', '0')
@@ -95,6 +107,7 @@ def get_gpu_info(dashboard):
 
     return gpu_info
 
+@coalesced
 def get_process_info(dashboard):
     """Get detailed process information"""
     process_info = {
@@ -110,43 +123,13 @@ def get_process_info(dashboard):
         }
     }
     
-    if dashboard.has_psutil:
+    if dashboard.process_table is not None:
         try:
-            processes = []
-            status_count = {'running': 0, 'sleeping': 0, 'zombie': 0, 'stopped': 0}
-            
-            for proc in dashboard.psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status', 'create_time', 'username']):
-                try:
-                    pinfo = proc.info
-                    pinfo['cpu_percent'] = proc.cpu_percent()
-                    pinfo['memory_mb'] = proc.memory_info().rss / 1024 / 1024  # Convert to MB
-                    processes.append(pinfo)
-                    
-                    # Count status
-                    status = pinfo.get('status', 'unknown').lower()
-                    if status in status_count:
-                        status_count[status] += 1
-                    elif status in ['running', 'disk-sleep']:
-                        status_count['running'] += 1
-                    else:
-                        status_count['sleeping'] += 1
-                        
-                except (dashboard.psutil.NoSuchProcess, dashboard.psutil.AccessDenied):
-                    continue
-            
-            process_info['total_processes'] = len(processes)
+            total, status_count, top_cpu, top_memory = dashboard.process_table.sample()
+            process_info['total_processes'] = total
             process_info['process_summary'] = status_count
-            
-            # Top 10 processes by CPU usage
-            process_info['top_cpu_processes'] = sorted(
-                processes, key=lambda x: x.get('cpu_percent', 0), reverse=True
-            )[:10]
-            
-            # Top 10 processes by memory usage
-            process_info['top_memory_processes'] = sorted(
-                processes, key=lambda x: x.get('memory_percent', 0), reverse=True
-            )[:10]
-            
+            process_info['top_cpu_processes'] = top_cpu
+            process_info['top_memory_processes'] = top_memory
         except Exception as e:
             process_info['error'] = str(e)
     else:
@@ -163,6 +146,7 @@ def get_process_info(dashboard):
     
     return process_info
 
+@coalesced
 def get_network_info(dashboard):
     """Get network interface information"""
     network_info = {
@@ -173,68 +157,52 @@ def get_network_info(dashboard):
         'active_connections': 0
     }
     
-    if dashboard.has_psutil:
-        try:
-            # Network interface statistics
-            net_io = dashboard.psutil.net_io_counters(pernic=True)
-            for interface, stats in net_io.items():
-                if interface != 'lo':  # Skip loopback
-                    network_info['interfaces'][interface] = {
-                        'bytes_sent': stats.bytes_sent,
-                        'bytes_recv': stats.bytes_recv,
-                        'packets_sent': stats.packets_sent,
-                        'packets_recv': stats.packets_recv,
-                        'errors_in': stats.errin,
-                        'errors_out': stats.errout,
-                        'drops_in': stats.dropin,
-                        'drops_out': stats.dropout
-                    }
-                    network_info['total_bytes_sent'] += stats.bytes_sent
-                    network_info['total_bytes_recv'] += stats.bytes_recv
-            
-            # Active network connections
-            connections = dashboard.psutil.net_connections()
-            network_info['active_connections'] = len([c for c in connections if c.status == 'ESTABLISHED'])
-            
-            # Connection summary
+    try:
+        interfaces = _get_interface_counters(dashboard)
+        now = time.monotonic()
+        with dashboard.stats_lock:
+            previous = dashboard.prev_net_counters
+            dashboard.prev_net_counters = (now, {name: dict(stats) for name, stats in interfaces.items()})
+        previous_time, previous_counters = previous or (None, None)
+        add_interface_rates(interfaces, previous_counters, now - previous_time if previous_time else None)
+
+        network_info['interfaces'] = interfaces
+        for stats in interfaces.values():
+            network_info['total_bytes_sent'] += stats['bytes_sent']
+            network_info['total_bytes_recv'] += stats['bytes_recv']
+        for field in ('bytes_sent_rate', 'bytes_recv_rate'):
+            rates = [stats[field] for stats in interfaces.values() if stats[field] is not None]
+            network_info[field] = round(sum(rates), 1) if rates else None
+
+        # Connection state histogram: /proc/net tables, psutil only where /proc is missing
+        connection_summary = read_connection_states()
+        if connection_summary is None and dashboard.has_psutil:
             connection_summary = {}
-            for conn in connections:
+            for conn in dashboard.psutil.net_connections():
                 status = conn.status or 'UNKNOWN'
                 connection_summary[status] = connection_summary.get(status, 0) + 1
+        if connection_summary is not None:
             network_info['connection_summary'] = connection_summary
-            
-        except Exception as e:
-            network_info['error'] = str(e)
-    else:
-        # Fallback without psutil
-        try:
-            # Get interface stats from /proc/net/dev
-            with open('/proc/net/dev', 'r') as f:
-                lines = f.readlines()[2:]  # Skip header lines
-                
-            for line in lines:
-                parts = line.split()
-                interface = parts[0].rstrip(':')
-                if interface != 'lo':  # Skip loopback
-                    network_info['interfaces'][interface] = {
-                        'bytes_recv': int(parts[1]),
-                        'packets_recv': int(parts[2]),
-                        'errors_in': int(parts[3]),
-                        'drops_in': int(parts[4]),
-                        'bytes_sent': int(parts[9]),
-                        'packets_sent': int(parts[10]),
-                        'errors_out': int(parts[11]),
-                        'drops_out': int(parts[12])
-                    }
-                    network_info['total_bytes_sent'] += int(parts[9])
-                    network_info['total_bytes_recv'] += int(parts[1])
-                    
-        except Exception as e:
-            network_info['error'] = str(e)
+            network_info['active_connections'] = connection_summary.get('ESTABLISHED', 0)
+
+    except Exception as e:
+        network_info['error'] = str(e)
     
     return network_info
 
 # Helper methods
+def get_rocm_product_name():
+    """GPU marketing name from rocm-smi (spawns a process; callers cache it)"""
+    try:
+        result = subprocess.run(['rocm-smi', '--showproductname', '--json'],
+                                capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            card_name_data = next(iter(json.loads(result.stdout).values()))
+            return card_name_data.get('Card Series', 'Unknown GPU')
+    except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError, AttributeError, StopIteration):
+        pass
+    return None
+
 def _get_uptime():
     """Get system uptime"""
     try:
@@ -252,33 +220,77 @@ def _get_load_average():
     except:
         return None
 
+def _read_proc_stat():
+    """Read cumulative CPU tick counters per cpu line ('cpu', 'cpu0', ...) from /proc/stat"""
+    counters = {}
+    with open('/proc/stat', 'r') as f:
+        for line in f:
+            if not line.startswith('cpu'):
+                break
+            parts = line.split()
+            counters[parts[0]] = tuple(int(p) for p in parts[1:len(CPU_STATES) + 1])
+    return counters
+
+def _cpu_percentages(current, previous):
+    """Busy percentage and per-state percentages between two counter tuples"""
+    if previous is None or len(previous) != len(current):
+        previous = (0,) * len(current)  # First reading: average since boot
+    deltas = [max(0, now - before) for now, before in zip(current, previous)]
+    total = sum(deltas)
+    if total <= 0:
+        return None, None
+    states = dict(zip(CPU_STATES, deltas))
+    idle = states['idle'] + states.get('iowait', 0)
+    busy = round(100.0 * (total - idle) / total, 1)
+    return busy, {state: round(100.0 * ticks / total, 1) for state, ticks in states.items()}
+
+def _get_cpu_usage(dashboard):
+    """CPU usage from /proc/stat deltas against the previous reading; never sleeps"""
+    usage = {'cpu_usage': None, 'cpu_per_core': [], 'cpu_times_percent': None}
+    try:
+        counters = _read_proc_stat()
+    except (OSError, ValueError):
+        return usage
+    
+    with dashboard.stats_lock:
+        previous = dashboard.prev_proc_stat or {}
+        dashboard.prev_proc_stat = counters
+    
+    for name, current in counters.items():
+        busy, states = _cpu_percentages(current, previous.get(name))
+        if name == 'cpu':
+            usage['cpu_usage'] = busy
+            usage['cpu_times_percent'] = states
+        else:
+            usage['cpu_per_core'].append(busy)
+    return usage
+
+def _get_interface_counters(dashboard):
+    """Per-interface counters from /proc/net/dev, or psutil where it is unreadable"""
+    try:
+        return read_interface_counters()
+    except OSError:
+        if not dashboard.has_psutil:
+            raise
+    interfaces = {}
+    for interface, stats in dashboard.psutil.net_io_counters(pernic=True).items():
+        if interface != 'lo':  # Skip loopback
+            interfaces[interface] = {
+                'bytes_sent': stats.bytes_sent,
+                'bytes_recv': stats.bytes_recv,
+                'packets_sent': stats.packets_sent,
+                'packets_recv': stats.packets_recv,
+                'errors_in': stats.errin,
+                'errors_out': stats.errout,
+                'drops_in': stats.dropin,
+                'drops_out': stats.dropout
+            }
+    return interfaces
+
 def _get_basic_system_info(dashboard):
     """Get basic system info without psutil"""
     info = {}
     
-    # CPU usage via /proc/stat
-    try:
-        with open('/proc/stat', 'r') as f:
-            line = f.readline()
-        
-        parts = [int(p) for p in line.split()[1:]]
-        idle_time = parts[3]
-        total_time = sum(parts)
-        
-        if dashboard.prev_proc_stat:
-            prev_idle, prev_total = dashboard.prev_proc_stat
-            
-            delta_idle = idle_time - prev_idle
-            delta_total = total_time - prev_total
-            
-            if delta_total > 0:
-                cpu_usage = 100.0 * (1.0 - (delta_idle / delta_total))
-                info['cpu_usage'] = round(cpu_usage, 1)
-        
-        dashboard.prev_proc_stat = (idle_time, total_time)
-    except Exception:
-        info['cpu_usage'] = None # Failed to calculate
-    
     try:
         # Memory info via /proc/meminfo
         with open('/proc/meminfo', 'r') as f:
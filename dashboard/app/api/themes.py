@@ -1,6 +1,9 @@
 import re
 from datetime import datetime
 
+from .singleflight import coalesced
+
+@coalesced
 def get_themes_info(dashboard):
     """Get information about themes and wallpapers"""
     themes_info = {
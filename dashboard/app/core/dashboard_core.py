@@ -1,12 +1,20 @@
 import sqlite3
+import threading
 from pathlib import Path
 
+from ..api.gpu_sysfs import SYSFS_DRM_ROOT, GpuInventory
+from ..api.process_table import ProcessTable, ProcProcessTable
+from ..api.system import get_rocm_product_name
+from .recorder import StatsRecorder
+from .sampler import MetricsSampler, default_collectors
+from .series import SeriesStore
+
 # psutil will be imported dynamically if available
 
 class EvilSpaceDashboard:
     """Main dashboard class for core logic and state"""
     
-    def __init__(self, dotfiles_path="/home/martin/dotfiles"):
+    def __init__(self, dotfiles_path="/home/martin/dotfiles", drm_root=SYSFS_DRM_ROOT):
         self.dotfiles_path = Path(dotfiles_path)
         self.dashboard_path = self.dotfiles_path / "dashboard"
         self.data_path = self.dashboard_path / "data"
@@ -15,10 +23,17 @@ class EvilSpaceDashboard:
         self.themes_path = self.dotfiles_path / "themes"
         self.wallpapers_path = self.dotfiles_path / "assets" / "wallpapers"
         
-        self.prev_proc_stat = None  # For CPU usage calculation
+        self.prev_proc_stat = None  # Previous /proc/stat counters per cpu line, for CPU usage deltas
+        self.prev_net_counters = None  # (monotonic time, counters per interface), for network rates
+        # GPU identity is discovered once and shared by every GPU reader
+        self.gpu_inventory = GpuInventory(drm_root, name_lookup=get_rocm_product_name)
+        self.stats_lock = threading.Lock()  # Guards previous-sample state across request threads
+        self.sampler = None  # Background metrics sampler, see start_sampler()
+        self.series = SeriesStore()  # Recent samples for sparklines, filled by the sampler
         
         # Initialize database
         self.init_database()
+        self.recorder = StatsRecorder(self.data_path / "dashboard.db")
         
         # Check for psutil availability
         self.has_psutil = False
@@ -29,6 +44,39 @@ class EvilSpaceDashboard:
         except ImportError:
             print("psutil not available, using basic system monitoring")
             self.psutil = None
+        # Process list: /proc directly where available; psutil handles are the fallback
+        # for hosts without /proc (see benchmarks/process_scan.py for the comparison)
+        if ProcProcessTable.available():
+            self.process_table = ProcProcessTable()
+        elif self.has_psutil:
+            self.process_table = ProcessTable(self.psutil)
+        else:
+            self.process_table = None
+    
+    def start_sampler(self, cadences=None):
+        """Start background sampling of system, GPU, process and network metrics"""
+        if self.sampler is None:
+            self.sampler = MetricsSampler(self, cadences=cadences)
+            self.sampler.add_listener(self.series.observe)
+        self.sampler.start()
+        return self.sampler
+    
+    def start_recorder(self):
+        """Record sampled metrics into system_stats and its rollups (starts the sampler if needed)"""
+        self.recorder.start(self.sampler or self.start_sampler())
+        return self.recorder
+    
+    def get_metrics(self, family):
+        """Latest sampled metrics for a family, collected on demand until the first sample lands"""
+        return self.get_metrics_entry(family)[1]
+    
+    def get_metrics_entry(self, family):
+        """(generation, data) for a family; generation is None for on-demand collections"""
+        if self.sampler is not None:
+            entry = self.sampler.get_entry(family)
+            if entry is not None:
+                return entry[0], entry[2]
+        return None, default_collectors()[family](self)
     
     def init_database(self):
         """Initialize SQLite database for persistent storage"""
@@ -0,0 +1,83 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bodies smaller than this are sent uncompressed; gzip overhead outweighs the savings
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+
+def dumps(data):
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Fall back to the stdlib for anything orjson rejects
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header matches the given ETag"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return '*' in tags or etag in tags
+
+class EncodedJson:
+    """A serialized JSON body with its ETag and a lazily built gzip variant"""
+
+    def __init__(self, body, etag):
+        self.body = body
+        self.etag = etag
+        self._gzip_body = None
+
+    @classmethod
+    def from_data(cls, data, etag=None):
+        """Serialize data; without an explicit ETag one is derived from the content"""
+        return cls.from_body(dumps(data), etag)
+
+    @classmethod
+    def from_body(cls, body, etag=None):
+        """Wrap already serialized JSON bytes; without an explicit ETag one is derived from the content"""
+        if etag is None:
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        return cls(body, etag)
+
+    @property
+    def gzip_body(self):
+        """Gzip-compressed body (built on first use, then reused)"""
+        if self._gzip_body is None:
+            self._gzip_body = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+        return self._gzip_body
+
+class SnapshotEncoder:
+    """Encodes each sampled snapshot once, however many clients request it
+
+    Entries are keyed by the sampler generation, which also forms the ETag
+    (prefixed with a per-process token so tags never repeat across restarts).
+    """
+
+    def __init__(self):
+        self._token = format(time.time_ns() & 0xffffffff, 'x')
+        self._entries = {}  # family -> (generation, EncodedJson)
+        self._lock = threading.Lock()
+
+    def encode(self, family, generation, data):
+        """Encoded body for a snapshot, reused while the generation is unchanged"""
+        if generation is None:
+            return EncodedJson.from_data(data)
+        entry = self._entries.get(family)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+        encoded = EncodedJson.from_data(data, etag=f'"{self._token}-{family}-{generation}"')
+        with self._lock:
+            current = self._entries.get(family)
+            if current is None or current[0] < generation:
+                self._entries[family] = (generation, encoded)
+        return encoded
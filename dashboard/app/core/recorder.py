@@ -0,0 +1,215 @@
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+# Recorded metrics: system_stats column -> (sampled family, extractor)
+METRICS = {
+    'cpu_usage': ('system', lambda data: data.get('cpu_usage')),
+    'memory_usage': ('system', lambda data: (data.get('memory') or {}).get('percent')),
+    'gpu_temp': ('gpu', lambda data: data.get('temperature')),
+    'gpu_usage': ('gpu', lambda data: data.get('usage')),
+}
+
+# Rollup tables: name -> bucket width in seconds
+ROLLUPS = {
+    'system_stats_1m': 60,
+    'system_stats_1h': 3600,
+}
+
+# Seconds of history kept per table
+DEFAULT_RETENTION = {
+    'system_stats': 2 * 86400,
+    'system_stats_1m': 14 * 86400,
+    'system_stats_1h': 400 * 86400,
+}
+
+# Longest window (seconds) served from each table, finest resolution first
+RESOLUTIONS = (
+    ('system_stats', 3600),
+    ('system_stats_1m', 2 * 86400),
+    ('system_stats_1h', 400 * 86400),
+)
+
+RANGE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+SQLITE_TIMESTAMP = '%Y-%m-%d %H:%M:%S'
+
+def parse_range(value):
+    """Parse a window like '90s', '15m', '6h' or '30d' into seconds"""
+    match = re.fullmatch(r'(\d+)([smhd])', (value or '').strip().lower())
+    if not match:
+        raise ValueError(f"Invalid range '{value}', expected e.g. 15m, 6h or 30d")
+    seconds = int(match.group(1)) * RANGE_UNITS[match.group(2)]
+    if seconds <= 0:
+        raise ValueError('Range must be positive')
+    return seconds
+
+class StatsRecorder:
+    """Records sampled metrics into system_stats with 1-minute and 1-hour rollups
+
+    Samples are buffered in memory and written by a background thread, one
+    transaction per batch, into the raw table plus the rollup tables (via
+    UPSERT on the bucket start). Old rows are pruned per table according to
+    the retention settings. The database runs in WAL mode so history queries
+    never block the writer.
+    """
+
+    def __init__(self, db_path, flush_interval=30.0, retention=None):
+        self.db_path = str(db_path)
+        self.flush_interval = flush_interval
+        self.retention = dict(DEFAULT_RETENTION)
+        if retention:
+            self.retention.update(retention)
+
+        self._latest = {}  # column -> last value seen, so each row carries every metric
+        self._pending = []  # (epoch seconds, {column: value})
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.init_schema()
+
+    def connect(self):
+        """Open a connection with the pragmas used by the recorder"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def init_schema(self):
+        """Create the rollup tables and indexes next to the existing system_stats table"""
+        conn = self.connect()
+        try:
+            columns = ', '.join(f'{metric}_sum REAL, {metric}_count INTEGER' for metric in METRICS)
+            with conn:
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_system_stats_timestamp ON system_stats (timestamp)')
+                for table in ROLLUPS:
+                    conn.execute(f'CREATE TABLE IF NOT EXISTS {table} (bucket INTEGER PRIMARY KEY, {columns})')
+        finally:
+            conn.close()
+
+    def observe(self, family, data):
+        """Sampler listener: buffer one row per system sample with the latest GPU values"""
+        if not isinstance(data, dict) or 'error' in data:
+            return
+        with self._lock:
+            for column, (source, extract) in METRICS.items():
+                if source == family:
+                    value = extract(data)
+                    self._latest[column] = float(value) if isinstance(value, (int, float)) else None
+            if family == 'system':
+                self._pending.append((int(time.time()), dict(self._latest)))
+
+    def start(self, sampler=None):
+        """Start the background writer, optionally subscribing to a sampler"""
+        if sampler is not None:
+            sampler.add_listener(self.observe)
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='stats-recorder', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Stop the writer and flush whatever is still buffered"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def flush(self):
+        """Write buffered samples and rollups in one transaction, then apply retention"""
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return 0
+
+        conn = self.connect()
+        try:
+            with conn:
+                self._insert_raw(conn, rows)
+                for table, width in ROLLUPS.items():
+                    self._upsert_rollup(conn, table, width, rows)
+                self._apply_retention(conn, rows[-1][0])
+        finally:
+            conn.close()
+        return len(rows)
+
+    def history(self, metric, window='1h'):
+        """Points for a metric over a window, at a resolution that suits its length"""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of: {', '.join(METRICS)}")
+        seconds = parse_range(window)
+        table = next((name for name, longest in RESOLUTIONS if seconds <= longest), RESOLUTIONS[-1][0])
+        since = int(time.time()) - seconds
+
+        conn = self.connect()
+        try:
+            if table == 'system_stats':
+                cursor = conn.execute(
+                    f"SELECT CAST(strftime('%s', timestamp) AS INTEGER), {metric} FROM system_stats "
+                    f"WHERE timestamp >= ? AND {metric} IS NOT NULL ORDER BY timestamp",
+                    (_to_sqlite_timestamp(since),)
+                )
+                resolution = 'raw'
+            else:
+                cursor = conn.execute(
+                    f"SELECT bucket, {metric}_sum / {metric}_count FROM {table} "
+                    f"WHERE bucket >= ? AND {metric}_count > 0 ORDER BY bucket",
+                    (since - since % ROLLUPS[table],)
+                )
+                resolution = f'{ROLLUPS[table]}s'
+            points = [[timestamp, round(value, 2)] for timestamp, value in cursor]
+        finally:
+            conn.close()
+
+        return {
+            'metric': metric,
+            'range': window,
+            'resolution': resolution,
+            'points': points,
+        }
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"Stats recorder flush failed: {e}")
+
+    def _insert_raw(self, conn, rows):
+        columns = list(METRICS)
+        placeholders = ', '.join('?' * (len(columns) + 1))
+        conn.executemany(
+            f"INSERT INTO system_stats (timestamp, {', '.join(columns)}) VALUES ({placeholders})",
+            [(_to_sqlite_timestamp(ts), *(values.get(c) for c in columns)) for ts, values in rows]
+        )
+
+    def _upsert_rollup(self, conn, table, width, rows):
+        # Aggregate the batch per bucket first so each bucket is one UPSERT
+        buckets = {}
+        for ts, values in rows:
+            totals = buckets.setdefault(ts - ts % width, {metric: [0.0, 0] for metric in METRICS})
+            for metric, value in values.items():
+                if value is not None:
+                    totals[metric][0] += value
+                    totals[metric][1] += 1
+
+        columns = [f'{metric}_{part}' for metric in METRICS for part in ('sum', 'count')]
+        updates = ', '.join(f'{column} = {column} + excluded.{column}' for column in columns)
+        conn.executemany(
+            f"INSERT INTO {table} (bucket, {', '.join(columns)}) VALUES ({', '.join('?' * (len(columns) + 1))}) "
+            f"ON CONFLICT(bucket) DO UPDATE SET {updates}",
+            [(bucket, *(v for metric in METRICS for v in totals[metric])) for bucket, totals in buckets.items()]
+        )
+
+    def _apply_retention(self, conn, now):
+        conn.execute('DELETE FROM system_stats WHERE timestamp < ?',
+                     (_to_sqlite_timestamp(now - self.retention['system_stats']),))
+        for table in ROLLUPS:
+            conn.execute(f'DELETE FROM {table} WHERE bucket < ?', (now - self.retention[table],))
+
+def _to_sqlite_timestamp(epoch_seconds):
+    """Epoch seconds as the UTC text format used by CURRENT_TIMESTAMP"""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime(SQLITE_TIMESTAMP)
@@ -0,0 +1,125 @@
+import threading
+import time
+
+from ..api import system
+
+# Seconds between collections for each metric family
+DEFAULT_CADENCES = {
+    'system': 2.0,
+    'gpu': 2.0,
+    'processes': 3.0,
+    'network': 2.0,
+}
+
+def default_collectors():
+    """Collector functions for the sampled metric families"""
+    return {
+        'system': system.get_system_info,
+        'gpu': system.get_gpu_info,
+        'processes': system.get_process_info,
+        'network': system.get_network_info,
+    }
+
+class MetricsSampler:
+    """Background sampler that keeps the latest snapshot of each metric family
+
+    Every family is collected on its own thread and cadence, so a slow
+    collector (e.g. rocm-smi) never delays the others. API handlers read the
+    latest snapshot instead of collecting on demand, which keeps request cost
+    constant no matter how many clients are watching.
+    """
+
+    def __init__(self, dashboard, collectors=None, cadences=None):
+        self.dashboard = dashboard
+        self.collectors = collectors or default_collectors()
+        self.cadences = dict(DEFAULT_CADENCES)
+        if cadences:
+            self.cadences.update(cadences)
+
+        self._snapshots = {}  # family -> (generation, sampled_at, data)
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call `callback(family, data)` on the sampling thread after every published sample"""
+        self._listeners.append(callback)
+
+    def start(self):
+        """Start one daemon thread per metric family"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for family in self.collectors:
+            thread = threading.Thread(target=self._run, args=(family,), name=f'sampler-{family}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=5.0):
+        """Stop sampling and wait for the threads to exit"""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def get(self, family):
+        """Latest data for a family, or None if it has not been sampled yet"""
+        entry = self._snapshots.get(family)
+        return entry[2] if entry else None
+
+    def get_entry(self, family):
+        """Latest (generation, sampled_at, data) for a family, or None"""
+        return self._snapshots.get(family)
+
+    def entries_since(self, generation):
+        """Snapshots published after the given generation, as {family: (generation, sampled_at, data)}"""
+        with self._condition:
+            snapshots = dict(self._snapshots)  # Sampling threads add families while starting up
+        return {family: entry for family, entry in snapshots.items() if entry[0] > generation}
+
+    def wait_for_update(self, generation, timeout=None):
+        """Block until a sample newer than `generation` is published (or timeout); returns the current generation"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._generation > generation or self._stop_event.is_set(), timeout)
+            return self._generation
+
+    @property
+    def running(self):
+        """True while the sampling threads are active"""
+        return bool(self._threads) and not self._stop_event.is_set()
+
+    @property
+    def generation(self):
+        """Monotonic counter bumped on every published sample"""
+        return self._generation
+
+    def _run(self, family):
+        collector = self.collectors[family]
+        interval = self.cadences.get(family, 2.0)
+
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                data = collector(self.dashboard)
+            except Exception as e:
+                data = {'error': str(e)}
+            self._publish(family, data)
+
+            elapsed = time.monotonic() - started
+            self._stop_event.wait(max(0.0, interval - elapsed))
+
+    def _publish(self, family, data):
+        with self._condition:
+            self._generation += 1
+            self._snapshots[family] = (self._generation, time.time(), data)
+            self._condition.notify_all()
+
+        for listener in self._listeners:
+            try:
+                listener(family, data)
+            except Exception as e:
+                print(f"Sampler listener failed for {family}: {e}")
@@ -0,0 +1,117 @@
+import math
+import threading
+import time
+from array import array
+
+from .recorder import METRICS
+
+# Points kept per series: 10 minutes at the default 2s sampling cadence
+SERIES_CAPACITY = 300
+
+# Upper bound on series present at once; series of interfaces that went away are dropped
+MAX_SERIES = 64
+
+# Network rate series: name prefix -> field of the network snapshot / interface entry
+NETWORK_SERIES = {
+    'net_rx': 'bytes_recv_rate',
+    'net_tx': 'bytes_sent_rate',
+}
+
+class RingBuffer:
+    """Fixed-size series of (timestamp, value) pairs stored in two array('d')
+
+    Memory is allocated once; appending overwrites the oldest point. Missing
+    values are stored as NaN and come back as None.
+    """
+
+    def __init__(self, capacity=SERIES_CAPACITY):
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, value):
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = math.nan if value is None else value
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def latest(self, points=None):
+        """(timestamps, values) of the newest `points` entries, oldest first"""
+        count = self._count if points is None else max(0, min(points, self._count))
+        start = (self._next - count) % self.capacity
+        if start + count <= self.capacity:
+            timestamps = self._timestamps[start:start + count]
+            values = self._values[start:start + count]
+        else:
+            timestamps = self._timestamps[start:] + self._timestamps[:self._next]
+            values = self._values[start:] + self._values[:self._next]
+        return timestamps, values
+
+class SeriesStore:
+    """Recent in-memory series for live sparklines, filled by the sampler
+
+    Holds the recorder's metrics (CPU, memory, GPU) plus network receive and
+    transmit rates, in total (`net_rx`) and per interface (`net_rx:eth0`).
+    Each series is a RingBuffer, so memory stays constant however long the
+    dashboard runs; longer windows are served by the recorder's history.
+    A series missing from its family's latest sample (an interface that was
+    removed, e.g. a container veth) is dropped to make room for new ones.
+    """
+
+    def __init__(self, capacity=SERIES_CAPACITY):
+        self.capacity = capacity
+        self._series = {}  # name -> RingBuffer
+        self._families = {}  # name -> sampler family that fills it
+        self._lock = threading.Lock()
+
+    def observe(self, family, data):
+        """Sampler listener: append the family's values to their series"""
+        if not isinstance(data, dict) or 'error' in data:
+            return
+        values = {metric: extract(data) for metric, (source, extract) in METRICS.items() if source == family}
+        if family == 'network':
+            for prefix, field in NETWORK_SERIES.items():
+                values[prefix] = data.get(field)
+                for interface, stats in (data.get('interfaces') or {}).items():
+                    values[f'{prefix}:{interface}'] = stats.get(field)
+        if not values:
+            return
+
+        now = time.time()
+        with self._lock:
+            # Series absent from the family's latest snapshot (e.g. a removed interface) are dropped
+            for name in [name for name, source in self._families.items() if source == family and name not in values]:
+                del self._series[name], self._families[name]
+            for name, value in values.items():
+                series = self._series.get(name)
+                if series is None:
+                    if len(self._series) >= MAX_SERIES:
+                        continue
+                    series = self._series[name] = RingBuffer(self.capacity)
+                    self._families[name] = family
+                series.append(now, float(value) if isinstance(value, (int, float)) else None)
+
+    def names(self):
+        """Names of the series collected so far"""
+        with self._lock:
+            return sorted(self._series)
+
+    def get(self, metric, points=None):
+        """Newest points of a series as parallel timestamp and value lists"""
+        with self._lock:
+            series = self._series.get(metric)
+            if series is None:
+                raise ValueError(f"Unknown series '{metric}', expected one of: {', '.join(sorted(self._series))}")
+            timestamps, values = series.latest(points)
+
+        return {
+            'metric': metric,
+            'capacity': self.capacity,
+            'timestamps': [round(timestamp, 1) for timestamp in timestamps],
+            'values': [None if math.isnan(value) else round(value, 2) for value in values],
+        }
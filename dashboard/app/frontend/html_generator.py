@@ -114,6 +114,16 @@ def get_dashboard_html():
             margin-bottom: 0;
         }
         
+        .sparkline {
+            height: 32px;
+            margin: -0.5rem 0 0.5rem;
+        }
+        
+        .sparkline svg {
+            width: 100%;
+            height: 100%;
+        }
+        
         .metric-label {
             color: #b0bec5;
             font-weight: 500;
@@ -317,9 +327,29 @@ def get_dashboard_html():
         let isActive = true;
         let currentTab = 'overview';
         
+        // Live metrics pushed over /api/stream (Server-Sent Events)
+        let eventSource = null;
+        let streamLive = false;
+        let streamRetryTimeout;
+        const streamState = {};
+        const streamRenderers = {
+            overview: {
+                system: data => renderSystemOverview(data),
+                gpu: data => renderGpuOverview(data),
+                processes: data => renderProcessesOverview(data),
+                network: data => renderNetworkOverview(data)
+            },
+            system: {
+                system: data => renderSystemDetails(data),
+                processes: data => renderProcessesDetails(data),
+                network: data => renderNetworkDetails(data)
+            }
+        };
+        
         // Tab switching
         function showTab(tabName) {
             loadTabData(tabName);
+            startUpdates(); // Polling interval depends on whether the tab is streamed
         }
         
         // Load data for specific tab
@@ -334,26 +364,33 @@ def get_dashboard_html():
             document.getElementById(tab).style.display = 'block';
             document.querySelector(`[onclick="showTab('${tab}')"]`).classList.add('active');
             
-            // Load tab-specific data
+            loadTabMetrics(tab);
+        }
+        
+        // Refresh the data shown on a tab (metric cards come from the stream when it is live)
+        function loadTabMetrics(tab) {
             switch(tab) {
                 case 'overview':
-                    loadSystemOverview();
-                    loadGpuOverview();
-                    loadProcessesOverview();
-                    loadNetworkOverview();
-                    loadLogsOverview();
-                    loadThemesOverview();
+                    // One batched request per tick; metric cards are skipped while streamed
+                    if (renderStreamedMetrics(tab)) {
+                        loadOverview(['logs', 'themes']);
+                    } else {
+                        loadOverview(['system', 'gpu', 'processes', 'network', 'logs', 'themes']);
+                    }
                     break;
                 case 'system':
-                    loadSystemDetails();
-                    loadProcessDetails();
-                    loadNetworkDetails();
+                    if (!renderStreamedMetrics(tab)) {
+                        loadSystemDetails();
+                        loadProcessesDetails();
+                        loadNetworkDetails();
+                    }
                     break;
                 case 'logs':
                     loadLogsDetails();
                     break;
                 case 'log-viewer':
                     loadLogFileList();
+                    tailJournal();
                     break;
                 case 'themes':
                     loadThemesDetails();
@@ -375,16 +412,85 @@ def get_dashboard_html():
             }
         }
         
+        // Sparklines: /api/series is fetched once per metric for the backlog, then every
+        // rendered sample (streamed or polled) is appended locally without further requests
+        const SPARKLINE_POINTS = 60;
+        const sparklines = {};  // metric -> { values, timestamp, svg }
+        
+        function sparklineSvg(values) {
+            const points = values.filter(value => value !== null);
+            if (points.length < 2) return '';
+            const max = Math.max(...points, 1);
+            const step = 100 / (values.length - 1);
+            const coords = values
+                .map((value, i) => value === null ? null : `${(i * step).toFixed(1)},${(30 - value / max * 28).toFixed(1)}`)
+                .filter(coord => coord !== null)
+                .join(' ');
+            return `<svg viewBox="0 0 100 32" preserveAspectRatio="none"><polyline points="${coords}" fill="none" stroke="#64ffda" stroke-width="1.5" vector-effect="non-scaling-stroke"/></svg>`;
+        }
+        
+        function sparklineSlot(metric) {
+            return `<div class="sparkline" data-series="${metric}">${sparklines[metric] ? sparklines[metric].svg : ''}</div>`;
+        }
+        
+        function pushSparkline(metric, value, timestamp) {
+            let series = sparklines[metric];
+            if (!series) {
+                series = sparklines[metric] = { values: [], timestamp: null, svg: '' };
+                loadSparkline(metric);
+            }
+            if (timestamp === series.timestamp) return; // Same sample rendered again
+            series.timestamp = timestamp;
+            series.values = series.values.concat([value ?? null]).slice(-SPARKLINE_POINTS);
+            series.svg = sparklineSvg(series.values);
+        }
+        
+        async function loadSparkline(metric) {
+            const data = await fetchAPI(`series?metric=${encodeURIComponent(metric)}&points=${SPARKLINE_POINTS}`);
+            if (data.error) return;
+            const series = sparklines[metric];
+            series.values = data.values;
+            series.svg = sparklineSvg(series.values);
+            document.querySelectorAll(`[data-series="${metric}"]`).forEach(slot => slot.innerHTML = series.svg);
+        }
+        
+        // Overview cards fetched together through /api/batch
+        const overviewRenderers = {
+            system: ['system-overview', data => renderSystemOverview(data)],
+            gpu: ['gpu-overview', data => renderGpuOverview(data)],
+            processes: ['processes-overview', data => renderProcessesOverview(data)],
+            network: ['network-overview', data => renderNetworkOverview(data)],
+            logs: ['logs-overview', data => renderLogsOverview(data)],
+            themes: ['themes-overview', data => renderThemesOverview(data)]
+        };
+        
+        async function loadOverview(sections) {
+            const elements = sections.map(section => document.getElementById(overviewRenderers[section][0]));
+            elements.forEach(element => element.classList.add('updating'));
+            
+            const data = await fetchAPI(`batch?e=${sections.join(',')}`);
+            sections.forEach(section => {
+                overviewRenderers[section][1](data.error ? data : (data[section] || { error: 'Missing from batch' }));
+            });
+            
+            elements.forEach(element => element.classList.remove('updating'));
+        }
+        
         // System overview
         async function loadSystemOverview() {
             const element = document.getElementById('system-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('system');
+            renderSystemOverview(await fetchAPI('system'));
+            element.classList.remove('updating');
+        }
+        
+        function renderSystemOverview(data) {
+            const element = document.getElementById('system-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
             } else {
+                pushSparkline('cpu_usage', data.cpu_usage, data.timestamp);
                 element.innerHTML = `
                     <div class="metric">
                         <span class="metric-label">
@@ -398,24 +504,27 @@ def get_dashboard_html():
                     </div>
                     <div class="metric">
                         <span class="metric-label">CPU Usage</span>
-                        <span class="metric-value">${data.cpu_usage ? data.cpu_usage.toFixed(1) + '%' : 'N/A'}</span>
+                        <span class="metric-value">${data.cpu_usage != null ? data.cpu_usage.toFixed(1) + '%' : 'N/A'}</span>
                     </div>
+                    ${sparklineSlot('cpu_usage')}
                     <div class="metric">
                         <span class="metric-label">Memory Usage</span>
                         <span class="metric-value">${data.memory ? (data.memory.percent.toFixed(1) + '%') : 'N/A'}</span>
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // GPU overview
         async function loadGpuOverview() {
             const element = document.getElementById('gpu-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('gpu');
+            renderGpuOverview(await fetchAPI('gpu'));
+            element.classList.remove('updating');
+        }
+        
+        function renderGpuOverview(data) {
+            const element = document.getElementById('gpu-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -435,7 +544,7 @@ def get_dashboard_html():
                     </div>
                     <div class="metric">
                         <span class="metric-label">VRAM</span>
-                        <span class="metric-value">${data.vram_percent !== null ? data.vram_percent + '%' : 'N/A'}</span>
+                        <span class="metric-value">${data.vram_total ? (data.vram_used / 1024).toFixed(1) + ' / ' + (data.vram_total / 1024).toFixed(1) + ' GB (' + data.vram_percent + '%)' : (data.vram_percent !== null ? data.vram_percent + '%' : 'N/A')}</span>
                     </div>
                     <div class="metric">
                         <span class="metric-label">Temperature</span>
@@ -451,16 +560,18 @@ def get_dashboard_html():
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // Process overview
         async function loadProcessesOverview() {
             const element = document.getElementById('processes-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('processes');
+            renderProcessesOverview(await fetchAPI('processes'));
+            element.classList.remove('updating');
+        }
+        
+        function renderProcessesOverview(data) {
+            const element = document.getElementById('processes-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -481,16 +592,18 @@ def get_dashboard_html():
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // Network overview
         async function loadNetworkOverview() {
             const element = document.getElementById('network-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('network');
+            renderNetworkOverview(await fetchAPI('network'));
+            element.classList.remove('updating');
+        }
+        
+        function renderNetworkOverview(data) {
+            const element = document.getElementById('network-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -498,6 +611,7 @@ def get_dashboard_html():
                 const interfaceCount = Object.keys(data.interfaces || {}).length;
                 const totalSent = (data.total_bytes_sent / 1024 / 1024 / 1024).toFixed(2);
                 const totalRecv = (data.total_bytes_recv / 1024 / 1024 / 1024).toFixed(2);
+                pushSparkline('net_rx', data.bytes_recv_rate, data.timestamp);
                 
                 element.innerHTML = `
                     <div class="metric">
@@ -512,22 +626,29 @@ def get_dashboard_html():
                         <span class="metric-label">Data Received</span>
                         <span class="metric-value">${totalRecv} GB</span>
                     </div>
+                    <div class="metric">
+                        <span class="metric-label">Throughput</span>
+                        <span class="metric-value">↑${formatRate(data.bytes_sent_rate)} ↓${formatRate(data.bytes_recv_rate)}</span>
+                    </div>
+                    ${sparklineSlot('net_rx')}
                     <div class="metric">
                         <span class="metric-label">Active Connections</span>
                         <span class="metric-value">${data.active_connections || 0}</span>
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // Logs overview
         async function loadLogsOverview() {
             const element = document.getElementById('logs-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('logs');
+            renderLogsOverview(await fetchAPI('logs'));
+            element.classList.remove('updating');
+        }
+        
+        function renderLogsOverview(data) {
+            const element = document.getElementById('logs-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -548,16 +669,18 @@ def get_dashboard_html():
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // Themes overview
         async function loadThemesOverview() {
             const element = document.getElementById('themes-overview');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('themes');
+            renderThemesOverview(await fetchAPI('themes'));
+            element.classList.remove('updating');
+        }
+        
+        function renderThemesOverview(data) {
+            const element = document.getElementById('themes-overview');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -577,16 +700,18 @@ def get_dashboard_html():
                     </div>
                 `;
             }
-            
-            element.classList.remove('updating');
         }
         
         // Detailed views (properly formatted)
         async function loadSystemDetails() {
             const element = document.getElementById('system-details');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('system');
+            renderSystemDetails(await fetchAPI('system'));
+            element.classList.remove('updating');
+        }
+        
+        function renderSystemDetails(data) {
+            const element = document.getElementById('system-details');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -618,10 +743,28 @@ def get_dashboard_html():
                         <h4 class="card-title">CPU Information</h4>
                         <div class="metric">
                             <span class="metric-label">Usage</span>
-                            <span class="metric-value">${data.cpu_usage ? data.cpu_usage.toFixed(1) + '%' : 'N/A'}</span>
+                            <span class="metric-value">${data.cpu_usage != null ? data.cpu_usage.toFixed(1) + '%' : 'N/A'}</span>
                         </div>
-                    </div>
                 `;
+                if (data.cpu_times_percent) {
+                    ['user', 'system', 'iowait', 'steal'].forEach(state => {
+                        html += `
+                        <div class="metric">
+                            <span class="metric-label">${state.charAt(0).toUpperCase() + state.slice(1)}</span>
+                            <span class="metric-value">${data.cpu_times_percent[state].toFixed(1)}%</span>
+                        </div>
+                        `;
+                    });
+                }
+                if (data.cpu_per_core && data.cpu_per_core.length > 0) {
+                    html += `
+                        <div class="metric">
+                            <span class="metric-label">Per Core</span>
+                            <span class="metric-value">${data.cpu_per_core.map(core => core != null ? Math.round(core) + '%' : '-').join(' ')}</span>
+                        </div>
+                    `;
+                }
+                html += '</div>';
                 
                 // Memory Card
                 if (data.memory) {
@@ -676,15 +819,17 @@ def get_dashboard_html():
                 html += '</div>';
                 element.innerHTML = html;
             }
-            
-            element.classList.remove('updating');
         }
         
         async function loadProcessesDetails() {
             const element = document.getElementById('processes-details');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('processes');
+            renderProcessesDetails(await fetchAPI('processes'));
+            element.classList.remove('updating');
+        }
+        
+        function renderProcessesDetails(data) {
+            const element = document.getElementById('processes-details');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -757,15 +902,17 @@ def get_dashboard_html():
                 html += '</div>';
                 element.innerHTML = html;
             }
-            
-            element.classList.remove('updating');
         }
         
         async function loadNetworkDetails() {
             const element = document.getElementById('network-details');
             element.classList.add('updating');
-            
-            const data = await fetchAPI('network');
+            renderNetworkDetails(await fetchAPI('network'));
+            element.classList.remove('updating');
+        }
+        
+        function renderNetworkDetails(data) {
+            const element = document.getElementById('network-details');
             
             if (data.error) {
                 element.innerHTML = `<div class="metric"><span class="status-indicator status-error"></span>Error: ${data.error}</div>`;
@@ -788,6 +935,10 @@ def get_dashboard_html():
                             <span class="metric-label">Total Received</span>
                             <span class="metric-value">${(data.total_bytes_recv / 1024 / 1024 / 1024).toFixed(2)} GB</span>
                         </div>
+                        <div class="metric">
+                            <span class="metric-label">Throughput</span>
+                            <span class="metric-value">↑${formatRate(data.bytes_sent_rate)} ↓${formatRate(data.bytes_recv_rate)}</span>
+                        </div>
                         <div class="metric">
                             <span class="metric-label">Active Connections</span>
                             <span class="metric-value">${data.active_connections || 0}</span>
@@ -808,7 +959,7 @@ def get_dashboard_html():
                         html += `
                             <div class="metric">
                                 <span class="metric-label">${interface}</span>
-                                <span class="metric-value">↑${sentMB}MB ↓${recvMB}MB</span>
+                                <span class="metric-value">↑${sentMB}MB ↓${recvMB}MB (↑${formatRate(stats.bytes_sent_rate)} ↓${formatRate(stats.bytes_recv_rate)})</span>
                             </div>
                         `;
                     });
@@ -838,8 +989,6 @@ def get_dashboard_html():
                 html += '</div>';
                 element.innerHTML = html;
             }
-            
-            element.classList.remove('updating');
         }
         
         async function loadLogsDetails() {
@@ -916,6 +1065,9 @@ def get_dashboard_html():
         // Log Viewer Functions
         let currentLogFile = '';
         let currentLogContent = [];
+        // Journal position of the viewer: refreshes fetch and append only newer entries
+        let journalTail = null;
+        const LOG_VIEW_MAX_LINES = 500;
         
         async function loadLogFileList() {
             const data = await fetchAPI('logs');
@@ -1036,9 +1188,11 @@ def get_dashboard_html():
                 const contentData = await contentResponse.json();
                 
                 if (contentData.error) {
+                    journalTail = null;
                     contentDiv.innerHTML = `<div style="color: #f44336;">Error: ${contentData.error}</div>`;
                 } else {
                     currentLogContent = contentData.lines || [];
+                    journalTail = contentData.cursor ? { file: currentLogFile, level: levelFilter, cursor: contentData.cursor } : null;
                     applyLogFilters(); // This now only applies search filters
                 }
                 
@@ -1059,12 +1213,69 @@ def get_dashboard_html():
             }
         }
         
+        async function tailJournal() {
+            const tail = journalTail;
+            if (!tail || tail.file !== currentLogFile) return;
+            
+            let endpoint = `logs/content?file=${encodeURIComponent(tail.file)}&lines=100&after=${encodeURIComponent(tail.cursor)}`;
+            if (tail.level && tail.level !== 'ALL') {
+                endpoint += `&level=${encodeURIComponent(tail.level)}`;
+            }
+            const data = await fetchAPI(endpoint);
+            if (data.error || journalTail !== tail) return; // Failed, or the selection changed meanwhile
+            
+            tail.cursor = data.cursor || tail.cursor;
+            const lines = data.lines || [];
+            if (lines.length === 0) return;
+            
+            currentLogContent = currentLogContent.concat(lines).slice(-LOG_VIEW_MAX_LINES);
+            appendLogLines(lines);
+        }
+        
+        function appendLogLines(lines) {
+            const contentDiv = document.getElementById('log-content');
+            // Filtered views carry a summary line that would go stale; re-render those
+            if (contentDiv.dataset.plain !== '1') {
+                applyLogFilters();
+                return;
+            }
+            
+            const atBottom = contentDiv.scrollTop + contentDiv.clientHeight >= contentDiv.scrollHeight - 4;
+            contentDiv.insertAdjacentHTML('beforeend', lines.map(logLineHtml).join(''));
+            while (contentDiv.childElementCount > LOG_VIEW_MAX_LINES) {
+                contentDiv.firstElementChild.remove();
+            }
+            if (atBottom) {
+                contentDiv.scrollTop = contentDiv.scrollHeight;
+            }
+        }
+        
+        function logLineHtml(line) {
+            let colorClass = '';
+            const lineUpper = line.toUpperCase();
+            
+            if (lineUpper.includes('ERROR') || lineUpper.includes('CRITICAL') || lineUpper.includes('FATAL') || lineUpper.includes('FAIL')) {
+                colorClass = 'color: #f44336;';
+            } else if (lineUpper.includes('WARNING') || lineUpper.includes('WARN') || lineUpper.includes('CAUTION')) {
+                colorClass = 'color: #ff9800;';
+            } else if (lineUpper.includes('INFO') || lineUpper.includes('INFORMATION') || lineUpper.includes('NOTICE')) {
+                colorClass = 'color: #2196f3;';
+            } else if (lineUpper.includes('DEBUG') || lineUpper.includes('TRACE') || lineUpper.includes('VERBOSE')) {
+                colorClass = 'color: #90a4ae;';
+            } else {
+                colorClass = 'color: #e0e0e0;';
+            }
+            
+            return `<div style="${colorClass}">${escapeHtml(line)}</div>`;
+        }
+        
         function applyLogFilters() {
             const levelFilter = document.getElementById('log-level-filter').value;
             const searchInput = document.getElementById('log-search-input').value.toLowerCase();
             const contentDiv = document.getElementById('log-content');
             
             let filteredLines = currentLogContent;
+            contentDiv.dataset.plain = '0';
             
             // Apply level filter - now using server-side filtering for better accuracy
             // This function just applies the search filter to already filtered content
@@ -1112,26 +1323,10 @@ def get_dashboard_html():
                 `;
             }
             
-            filteredLines.forEach(line => {
-                let colorClass = '';
-                const lineUpper = line.toUpperCase();
-                
-                if (lineUpper.includes('ERROR') || lineUpper.includes('CRITICAL') || lineUpper.includes('FATAL') || lineUpper.includes('FAIL')) {
-                    colorClass = 'color: #f44336;';
-                } else if (lineUpper.includes('WARNING') || lineUpper.includes('WARN') || lineUpper.includes('CAUTION')) {
-                    colorClass = 'color: #ff9800;';
-                } else if (lineUpper.includes('INFO') || lineUpper.includes('INFORMATION') || lineUpper.includes('NOTICE')) {
-                    colorClass = 'color: #2196f3;';
-                } else if (lineUpper.includes('DEBUG') || lineUpper.includes('TRACE') || lineUpper.includes('VERBOSE')) {
-                    colorClass = 'color: #90a4ae;';
-                } else {
-                    colorClass = 'color: #e0e0e0;';
-                }
-                
-                html += `<div style="${colorClass}">${escapeHtml(line)}</div>`;
-            });
+            html += filteredLines.map(logLineHtml).join('');
             
             contentDiv.innerHTML = html;
+            contentDiv.dataset.plain = showFilterInfo ? '0' : '1';
         }
         
         function clearLogFilters() {
@@ -1204,6 +1399,13 @@ def get_dashboard_html():
             return div.innerHTML;
         }
         
+        function formatRate(bytesPerSecond) {
+            if (bytesPerSecond === null || bytesPerSecond === undefined) return '—';
+            if (bytesPerSecond >= 1024 * 1024) return `${(bytesPerSecond / 1024 / 1024).toFixed(1)} MB/s`;
+            if (bytesPerSecond >= 1024) return `${(bytesPerSecond / 1024).toFixed(1)} KB/s`;
+            return `${Math.round(bytesPerSecond)} B/s`;
+        }
+        
         async function loadThemesDetails() {
             const element = document.getElementById('themes-details');
             element.classList.add('updating');
@@ -1389,13 +1591,72 @@ def get_dashboard_html():
             element.classList.remove('updating');
         }
         
+        // Metrics stream: full snapshot first, then only changed fields
+        function startStream() {
+            if (!window.EventSource || eventSource) {
+                return;
+            }
+            eventSource = new EventSource('/api/stream');
+            eventSource.addEventListener('snapshot', event => applyStreamEvent(JSON.parse(event.data), true));
+            eventSource.addEventListener('delta', event => applyStreamEvent(JSON.parse(event.data), false));
+            eventSource.onopen = () => {
+                streamLive = true;
+                startUpdates();
+            };
+            eventSource.onerror = () => {
+                // Fall back to polling and try the stream again later
+                stopStream();
+                startUpdates();
+                streamRetryTimeout = setTimeout(startStream, 15000);
+            };
+        }
+        
+        function stopStream() {
+            clearTimeout(streamRetryTimeout);
+            if (eventSource) {
+                eventSource.close();
+                eventSource = null;
+            }
+            streamLive = false;
+        }
+        
+        function applyStreamEvent(payload, replace) {
+            Object.entries(payload).forEach(([family, data]) => {
+                streamState[family] = replace ? data : Object.assign({}, streamState[family], data);
+            });
+            if (document.visibilityState !== 'visible') {
+                return; // Rendered from streamState when the page becomes visible
+            }
+            const renderers = streamRenderers[currentTab] || {};
+            Object.keys(payload).forEach(family => {
+                if (renderers[family]) {
+                    renderers[family](streamState[family]);
+                }
+            });
+        }
+        
+        function renderStreamedMetrics(tab) {
+            const renderers = streamRenderers[tab];
+            if (!streamLive || !renderers) {
+                return false;
+            }
+            Object.entries(renderers).forEach(([family, render]) => {
+                if (streamState[family]) {
+                    render(streamState[family]);
+                }
+            });
+            return true;
+        }
+        
         // Update frequency management
         function startUpdates() {
             stopUpdates();
-            const interval = isActive ? 2000 : 30000; // 2s active, 30s inactive
+            // Streamed tabs only poll for the remaining cards (logs, themes)
+            const streamed = streamLive && streamRenderers[currentTab];
+            const interval = (isActive && !streamed) ? 2000 : 30000; // 2s active, 30s inactive or streamed
             updateInterval = setInterval(() => {
                 if (document.visibilityState === 'visible') {
-                    loadTabData(currentTab);
+                    loadTabMetrics(currentTab);
                 }
             }, interval);
         }
@@ -1438,6 +1699,7 @@ def get_dashboard_html():
         window.addEventListener('load', () => {
             loadTabData('overview');
             startUpdates();
+            startStream();
             resetActivityTimer();
         });
     </script>
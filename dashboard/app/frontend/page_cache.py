@@ -0,0 +1,129 @@
+import gzip
+import hashlib
+import importlib
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from . import html_generator
+
+# Preferred order when the client accepts several encodings
+ENCODING_PREFERENCE = ('br', 'gzip', 'identity')
+ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gz', 'identity': ''}
+
+class PageVariant:
+    """One encoded form of the built page"""
+
+    def __init__(self, encoding, body, etag):
+        self.encoding = encoding
+        self.body = body
+        self.etag = etag
+
+class PageCache:
+    """Dashboard HTML built once and kept precompressed
+
+    The page is rendered at construction time and stored as identity, gzip and
+    (when the brotli module is installed) brotli variants with per-variant
+    ETags. With `watch=True` the generator module is re-imported and the page
+    rebuilt whenever its source file changes, which is handy while editing the
+    frontend.
+    """
+
+    def __init__(self, watch=False, check_interval=1.0):
+        self.watch = watch
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._source_mtime = self._get_source_mtime()
+        self._next_check = 0.0
+        self._build()
+
+    def select(self, accept_encoding):
+        """Pick the best variant for an Accept-Encoding header"""
+        if self.watch:
+            self._rebuild_if_changed()
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*')
+        variants = self._variants
+        for encoding in ENCODING_PREFERENCE:
+            # Unlisted encodings follow '*'; identity is acceptable unless refused
+            default = wildcard if wildcard is not None else (1.0 if encoding == 'identity' else 0.0)
+            if encoding in variants and accepted.get(encoding, default) > 0:
+                return variants[encoding]
+        return variants['identity']
+
+    def is_not_modified(self, if_none_match, if_modified_since):
+        """Whether conditional request headers match the current page"""
+        if if_none_match:
+            tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return '*' in tags or any(variant.etag in tags for variant in self._variants.values())
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= int(self.built_at)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @property
+    def last_modified(self):
+        """Build time as an HTTP date"""
+        return formatdate(self.built_at, usegmt=True)
+
+    def _build(self):
+        body = html_generator.get_dashboard_html().encode()
+        digest = hashlib.sha256(body).hexdigest()[:16]
+
+        variants = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(body, quality=11)
+
+        self._variants = {
+            encoding: PageVariant(encoding, data, f'"{digest}{ETAG_SUFFIXES[encoding]}"')
+            for encoding, data in variants.items()
+        }
+        self.built_at = time.time()
+
+    def _rebuild_if_changed(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            self._next_check = now + self.check_interval
+            mtime = self._get_source_mtime()
+            if mtime == self._source_mtime:
+                return
+            importlib.reload(html_generator)
+            self._source_mtime = mtime
+            self._build()
+            print("Dashboard page rebuilt after frontend change")
+
+    @staticmethod
+    def _get_source_mtime():
+        try:
+            return os.stat(html_generator.__file__).st_mtime_ns
+        except OSError:
+            return None
+
+def parse_accept_encoding(header):
+    """Map of encoding -> q-value from an Accept-Encoding header"""
+    accepted = {}
+    for item in (header or '').split(','):
+        name, _, params = item.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
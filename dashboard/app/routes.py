@@ -0,0 +1,148 @@
+import threading
+import time
+
+from .api import logs, themes, scripts
+from .api.singleflight import SingleFlight, collectors
+from .core.json_encoding import EncodedJson
+
+# Cost hints: cheap routes run inline, expensive ones are spread over the batch pool
+COST_LOW = 'low'
+COST_HIGH = 'high'
+
+# Seconds a request waits for a free slot on a concurrency-limited route
+ROUTE_SLOT_TIMEOUT = 10.0
+# Memoized results kept before expired entries are pruned
+CACHE_PRUNE_SIZE = 256
+
+class RouteBusy(Exception):
+    """Raised when a concurrency-limited route has no free slot"""
+
+class Route:
+    """One API path with its handler and caching policy
+
+    `handler(dashboard, params)` returns data to serialize, or an EncodedJson
+    that is sent as-is. With a `ttl` results are memoized per parameter set;
+    identical requests that arrive while a result is being computed wait for
+    it instead of computing it again. `max_concurrency` bounds the number of
+    distinct computations running at once.
+    """
+
+    def __init__(self, path, handler, ttl=0.0, max_concurrency=None, cost=COST_LOW, batchable=False):
+        self.path = path
+        self.handler = handler
+        self.ttl = ttl
+        self.cost = cost
+        self.batchable = batchable
+        self.slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+class Router:
+    """Registry of API routes with TTL memoization and request coalescing"""
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+        self.routes = {}
+        self._cache = {}  # (path, params) -> (expires_at, EncodedJson)
+        self._lock = threading.Lock()
+        self.flights = SingleFlight()
+
+    def add(self, path, handler, **options):
+        """Register a handler for an exact path"""
+        self.routes[path] = Route(path, handler, **options)
+        return self.routes[path]
+
+    def match(self, path):
+        """Route for a request path (query string ignored), or None"""
+        return self.routes.get(path.split('?', 1)[0])
+
+    def call(self, route, params=None):
+        """Run a route, serving memoized or in-flight results where possible"""
+        params = params or {}
+        key = (route.path, tuple(sorted(params.items())))
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return self.flights.do(route.path, key, self._compute_and_store, route, key, params)
+
+    def _store(self, key, ttl, result):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._cache) >= CACHE_PRUNE_SIZE:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            self._cache[key] = (now + ttl, result)
+
+    def _compute_and_store(self, route, key, params):
+        result, failed = self._compute(route, params)
+        if route.ttl > 0 and not failed:  # A failure is retried by the next request
+            self._store(key, route.ttl, result)
+        return result
+
+    def _compute(self, route, params):
+        """(encoded result, whether the handler raised)"""
+        if route.slots is not None and not route.slots.acquire(timeout=ROUTE_SLOT_TIMEOUT):
+            raise RouteBusy(f'{route.path} is busy, try again shortly')
+        try:
+            try:
+                result, failed = route.handler(self.dashboard, params), False
+            except Exception as e:
+                result, failed = {'error': str(e)}, True
+            return (result if isinstance(result, EncodedJson) else EncodedJson.from_data(result)), failed
+        finally:
+            if route.slots is not None:
+                route.slots.release()
+
+def _log_file_param(params):
+    """The `file` parameter of the log endpoints (a filename or an identifier like journal:current)"""
+    log_file = params.get('file', '')
+    if not log_file or log_file == 'undefined':
+        raise ValueError('Log file parameter required')
+    return log_file
+
+def _log_content(dashboard, params):
+    try:
+        log_file = _log_file_param(params)
+    except ValueError as e:
+        return {'error': str(e), 'lines': []}
+    return logs.get_log_content(dashboard, log_file, int(params.get('lines', '100')),
+                                params.get('level'), params.get('search'), params.get('after') or None)
+
+def _log_stats(dashboard, params):
+    return logs.get_log_stats(dashboard, _log_file_param(params), params.get('since') or None)
+
+def _history(dashboard, params):
+    return dashboard.recorder.history(params.get('metric', 'cpu_usage'), params.get('range', '1h'))
+
+def _series(dashboard, params):
+    metric = params.get('metric')
+    if not metric:
+        return {'metrics': dashboard.series.names()}
+    points = params.get('points')
+    return dashboard.series.get(metric, int(points) if points else None)
+
+def build_router(dashboard, snapshot_encoder):
+    """Router with every JSON API route of the dashboard"""
+    router = Router(dashboard)
+
+    # Sampled families are already cached per sampler generation
+    for family in ('system', 'gpu', 'processes', 'network'):
+        def sampled(dashboard, params, family=family):
+            generation, data = dashboard.get_metrics_entry(family)
+            return snapshot_encoder.encode(family, generation, data)
+        router.add(f'/api/{family}', sampled, batchable=True)
+
+    router.add('/api/logs', lambda dashboard, params: logs.get_logs_info(dashboard),
+               ttl=5.0, cost=COST_HIGH, batchable=True)
+    router.add('/api/themes', lambda dashboard, params: themes.get_themes_info(dashboard),
+               ttl=5.0, cost=COST_HIGH, batchable=True)
+    router.add('/api/scripts', lambda dashboard, params: scripts.get_scripts_info(dashboard),
+               ttl=30.0, cost=COST_HIGH, batchable=True)
+    router.add('/api/logs/content', _log_content, ttl=1.0, max_concurrency=2, cost=COST_HIGH)
+    router.add('/api/logs/stats', _log_stats, ttl=5.0, max_concurrency=2, cost=COST_HIGH)
+    router.add('/api/history', _history, ttl=5.0, max_concurrency=2, cost=COST_HIGH)
+    router.add('/api/series', _series)
+    router.add('/api/coalescing', lambda dashboard, params: {
+        'collectors': collectors.stats(),
+        'routes': router.flights.stats(),
+    })
+    return router
@@ -1,148 +1,311 @@
 import http.server
 import socketserver
 import json
-import os
 import functools
 import socket
+from urllib.parse import parse_qs, urlparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from .frontend.html_generator import get_dashboard_html
-from .api import system, logs, themes, scripts
+from .core.json_encoding import GZIP_MIN_SIZE, EncodedJson, SnapshotEncoder, dumps, etag_matches
+from .frontend.page_cache import PageCache, parse_accept_encoding
+from .routes import COST_HIGH, RouteBusy, build_router
+
+# Metric families pushed over /api/stream
+SAMPLED_FAMILIES = ('system', 'gpu', 'processes', 'network')
+MAX_BATCH_SECTIONS = 16
+KEEPALIVE_TIMEOUT = 10  # Seconds an idle keep-alive connection may hold a worker
+STREAM_HEARTBEAT = 15.0  # Seconds between keepalive comments on an idle stream
+STREAM_RETRY_MS = 3000  # Browser reconnect delay advertised to EventSource
+
+def diff_fields(previous, current):
+    """Top-level fields of `current` that differ from `previous`, or None if fields were added or removed"""
+    if not isinstance(previous, dict) or not isinstance(current, dict) or previous.keys() != current.keys():
+        return None
+    return {key: value for key, value in current.items() if previous[key] != value}
 
 class EvilSpaceHandler(http.server.SimpleHTTPRequestHandler):
     """Custom HTTP handler for the Evil Space Dashboard"""
     
+    # Keep-alive: every response carries Content-Length (event streams close instead)
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+    
     def __init__(self, *args, dashboard_instance=None, **kwargs):
         self.dashboard = dashboard_instance
-        # The 'directory' argument is not used by our handler, but is passed by TCPServer
-        if 'directory' in kwargs:
-             del kwargs['directory']
+        # Static files are resolved against the dashboard directory per request,
+        # so no process-wide chdir is needed (unsafe with concurrent requests)
+        kwargs.setdefault('directory', str(dashboard_instance.dashboard_path))
         super().__init__(*args, **kwargs)
     
+    def end_headers(self):
+        """Finish headers, shedding keep-alive when the worker pool is nearly full"""
+        # An idle keep-alive connection pins a worker thread, so stop holding them under load
+        if not self.close_connection and self.server.pool_is_busy():
+            self.send_header('Connection', 'close')
+        super().end_headers()
+    
     def do_GET(self):
         """Handle GET requests"""
         if self.path == '/':
             self.serve_dashboard()
+        elif self.path.split('?')[0] == '/api/stream':
+            self.serve_event_stream()
         elif self.path.startswith('/api/'):
             self.handle_api_request()
         else:
-            # For static files, we need to set the directory context
-            # The 'directory' kwarg is not available in __init__ in Python < 3.8
-            # So we temporarily chdir. This is safe due to single-threaded nature of the server.
-            cwd = os.getcwd()
-            try:
-                os.chdir(self.dashboard.dashboard_path)
-                super().do_GET()
-            finally:
-                os.chdir(cwd)
+            super().do_GET()
 
     def serve_dashboard(self):
-        """Serve the main dashboard HTML"""
-        html_content = get_dashboard_html()
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+        """Serve the main dashboard HTML from the precompressed page cache"""
+        page_cache = self.server.page_cache
+        variant = page_cache.select(self.headers.get('Accept-Encoding'))
+        not_modified = page_cache.is_not_modified(self.headers.get('If-None-Match'),
+                                                  self.headers.get('If-Modified-Since'))
+        
+        self.send_response(304 if not_modified else 200)
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('ETag', variant.etag)
+        self.send_header('Last-Modified', page_cache.last_modified)
+        self.send_header('Cache-Control', 'no-cache')  # Always revalidate, usually a 304
+        self.send_header('Vary', 'Accept-Encoding')
+        if not_modified:
+            self.end_headers()
+            return
+        if variant.encoding != 'identity':
+            self.send_header('Content-Encoding', variant.encoding)
+        self.send_header('Content-Length', str(len(variant.body)))
         self.end_headers()
-        self.wfile.write(html_content.encode())
+        self.wfile.write(variant.body)
     
-    def handle_api_request(self):
-        """Handle API requests"""
-        # Handle nested endpoints like logs/content and logs/stats
-        path_parts = self.path.split('/')
-        endpoint = path_parts[-1].split('?')[0]
-        
-        # Check for nested endpoints
-        if len(path_parts) >= 4 and path_parts[2] == 'logs':
-            nested_endpoint = path_parts[3].split('?')[0]
-            
-            from urllib.parse import parse_qs, urlparse
-            parsed_url = urlparse(self.path)
-            params = parse_qs(parsed_url.query)
-            
-            if nested_endpoint == 'content':
-                # Handle logs/content endpoint
-                log_file = params.get('file', [''])[0]
-                lines = int(params.get('lines', ['100'])[0])
-                filter_level = params.get('level', [None])[0]
-                search_term = params.get('search', [None])[0]
-                
-                if log_file and log_file != 'undefined':
-                    # Use the log_file as-is (could be filename or special identifier like journal:current)
-                    data = logs.get_log_content(self.dashboard, log_file, lines, filter_level, search_term)
-                else:
-                    data = {'error': 'Log file parameter required', 'lines': []}
-            elif nested_endpoint == 'stats':
-                # Handle logs/stats endpoint
-                log_file = params.get('file', [''])[0]
-                
-                if log_file and log_file != 'undefined':
-                    # Use the log_file as-is (could be filename or special identifier like journal:current)
-                    data = logs.get_log_stats(self.dashboard, log_file)
-                else:
-                    data = {'error': 'Log file parameter required'}
-            else:
-                data = {'error': f'Unknown logs endpoint: {nested_endpoint}'}
-        else:
-            # Handle regular endpoints
-            try:
-                if endpoint == 'system':
-                    data = system.get_system_info(self.dashboard)
-                elif endpoint == 'gpu':
-                    data = system.get_gpu_info(self.dashboard)
-                elif endpoint == 'processes':
-                    data = system.get_process_info(self.dashboard)
-                elif endpoint == 'network':
-                    data = system.get_network_info(self.dashboard)
-                elif endpoint == 'logs':
-                    data = logs.get_logs_info(self.dashboard)
-                elif endpoint == 'themes':
-                    data = themes.get_themes_info(self.dashboard)
-                elif endpoint == 'scripts':
-                    data = scripts.get_scripts_info(self.dashboard)
-                else:
-                    data = {'error': f'Unknown endpoint: {endpoint}'}
-                    
-            except Exception as e:
-                data = {'error': str(e)}
-        
+    def serve_event_stream(self):
+        """Push sampled metrics as Server-Sent Events
+
+        The first event is a full `snapshot` of every family; after that each
+        new sample is sent as a `delta` carrying only the top-level fields that
+        changed. A family whose field set changed is re-sent as a snapshot.
+        """
+        sampler = self.dashboard.sampler
+        if sampler is None or not sampler.running:
+            self.send_json_error(503, 'Metrics sampler is not running')
+            return
+
+        # Every stream pins a worker thread, so keep some free for regular requests
+        slots = self.server.stream_slots
+        if not slots.acquire(blocking=False):
+            self.send_json_error(503, 'Too many open streams', retry_after=STREAM_RETRY_MS // 1000)
+            return
+
         try:
             self.send_response(200)
-            self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            self.wfile.write(json.dumps(data, indent=2).encode())
-            
+            self.close_connection = True
+
+            generation = sampler.generation
+            sent = {family: sampler.get(family) for family in SAMPLED_FAMILIES}
+            self.write_event('snapshot', {family: data for family, data in sent.items() if data is not None},
+                             event_id=generation, retry=STREAM_RETRY_MS)
+
+            while sampler.running:
+                current = sampler.wait_for_update(generation, timeout=STREAM_HEARTBEAT)
+                if current == generation:
+                    self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+                    continue
+
+                snapshot, delta = {}, {}
+                for family, (_, _, data) in sampler.entries_since(generation).items():
+                    if family not in sent:
+                        continue
+                    changed = diff_fields(sent[family], data)
+                    if changed is None:
+                        snapshot[family] = data
+                    elif changed:
+                        delta[family] = changed
+                    sent[family] = data
+                generation = current
+
+                if snapshot:
+                    self.write_event('snapshot', snapshot, event_id=generation)
+                if delta:
+                    self.write_event('delta', delta, event_id=generation)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            pass  # Client went away
+        finally:
+            slots.release()
+
+    def write_event(self, event, data, event_id=None, retry=None):
+        """Write one Server-Sent Event with a JSON payload"""
+        lines = []
+        if retry is not None:
+            lines.append(f'retry: {retry}')
+        if event_id is not None:
+            lines.append(f'id: {event_id}')
+        lines.append(f'event: {event}')
+        lines.append(f'data: {dumps(data).decode()}')
+        self.wfile.write(('\n'.join(lines) + '\n\n').encode())
+        self.wfile.flush()
+
+    def send_json_error(self, status, message, retry_after=None):
+        """Send a JSON error response"""
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if retry_after is not None:
+            self.send_header('Retry-After', str(retry_after))
+        body = json.dumps({'error': message}).encode()
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_api_request(self):
+        """Handle API requests through the route registry"""
+        parsed_url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed_url.query).items()}
+        
+        try:
+            if parsed_url.path == '/api/batch':
+                encoded = self.handle_batch(params)
+            else:
+                route = self.server.router.match(parsed_url.path)
+                if route is None:
+                    self.send_json_error(404, f"Unknown endpoint: {parsed_url.path.removeprefix('/api/')}")
+                    return
+                encoded = self.server.router.call(route, params)
+            self.send_json(encoded)
+        except RouteBusy as e:
+            self.send_json_error(503, str(e), retry_after=1)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
+            self.send_json_error(500, str(e))
+    
+    def handle_batch(self, params):
+        """One document {section: data} for /api/batch?e=..., collected concurrently"""
+        router = self.server.router
+        sections = list(dict.fromkeys(name for name in params.get('e', '').split(',') if name))
+        if not sections:
+            return EncodedJson.from_data({'error': 'Batch parameter e required, e.g. e=system,gpu'})
+        if len(sections) > MAX_BATCH_SECTIONS:
+            return EncodedJson.from_data({'error': f'At most {MAX_BATCH_SECTIONS} sections per batch'})
+        
+        routes = {name: router.match(f'/api/{name}') for name in sections}
+        # Cheap sections run inline; expensive ones are spread over the batch pool
+        pending = {name: self.server.batch_executor.submit(router.call, route)
+                   for name, route in routes.items() if route and route.batchable and route.cost == COST_HIGH}
+        parts = []
+        for name, route in routes.items():
+            if name in pending:
+                encoded = pending[name].result()
+            elif route and route.batchable:
+                encoded = router.call(route)
+            else:
+                encoded = EncodedJson.from_data({'error': f'Unknown endpoint: {name}'})
+            parts.append(dumps(name) + b':' + encoded.body)
+        return EncodedJson.from_body(b'{' + b','.join(parts) + b'}')
+    
+    def send_json(self, encoded):
+        """Send an encoded JSON body, honouring If-None-Match and gzip negotiation"""
+        if etag_matches(self.headers.get('If-None-Match'), encoded.etag):
+            self.send_response(304)
+            self.send_header('ETag', encoded.etag)
+            self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            error_data = {'error': str(e)}
-            self.wfile.write(json.dumps(error_data).encode())
+            return
+        
+        body = encoded.body
+        gzipped = (len(body) >= GZIP_MIN_SIZE
+                   and parse_accept_encoding(self.headers.get('Accept-Encoding')).get('gzip', 0) > 0)
+        if gzipped:
+            body = encoded.gzip_body
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('ETag', encoded.etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class BoundedThreadingTCPServer(socketserver.TCPServer):
+    """TCP server that handles each connection on a bounded pool of worker threads
 
-def run_server(dashboard_instance):
-    """Main function to start the dashboard server"""
+    A slow endpoint only ties up one worker, so static files and other API
+    calls keep being served. Connections beyond the pool size wait in the
+    executor queue instead of spawning unbounded threads. Long-lived event
+    streams are capped at `max_streams` so they cannot starve the pool.
+    """
+    allow_reuse_address = True
+    request_queue_size = 64
+
+    def __init__(self, server_address, handler_class, router, max_workers=8, max_streams=None, page_cache=None):
+        self.router = router
+        self.page_cache = page_cache or PageCache()
+        self.batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='dashboard-batch')
+        self.max_workers = max_workers
+        self.active_connections = 0
+        self._active_lock = threading.Lock()
+        if max_streams is None:
+            max_streams = max(1, max_workers // 2)
+        self.stream_slots = threading.BoundedSemaphore(max_streams)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dashboard-http')
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool"""
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def pool_is_busy(self):
+        """True when at most one worker is left for new connections"""
+        return self.active_connections >= self.max_workers - 1
+
+    def _process_request_worker(self, request, client_address):
+        with self._active_lock:
+            self.active_connections += 1
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._active_lock:
+                self.active_connections -= 1
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+        self.batch_executor.shutdown(wait=False)
+
+def run_server(dashboard_instance, port=8080, max_workers=8, max_streams=None, reload_html=False):
+    """Main function to start the dashboard server
+
+    With `reload_html` the page is rebuilt whenever the frontend generator
+    module changes on disk; otherwise it is built once at startup.
+    """
     
     # Create handler with the dashboard instance
     handler = functools.partial(EvilSpaceHandler, dashboard_instance=dashboard_instance)
     
-    # Start server
-    PORT = 8080
-    
-    # Ensure we are serving from the dashboard directory for static assets
-    os.chdir(dashboard_instance.dashboard_path)
-    
-    # Create server with socket reuse enabled
-    class ReusableTCPServer(socketserver.TCPServer):
-        allow_reuse_address = True
-        
-        def server_bind(self):
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            super().server_bind()
+    router = build_router(dashboard_instance, SnapshotEncoder())
     
-    with ReusableTCPServer(("", PORT), handler) as httpd:
-        print(f"Evil Space Dashboard running at http://localhost:{PORT}")
+    with BoundedThreadingTCPServer(("", port), handler, router, max_workers=max_workers, max_streams=max_streams,
+                                   page_cache=PageCache(watch=reload_html)) as httpd:
+        print(f"Evil Space Dashboard running at http://localhost:{port}")
+        print(f"Serving requests on {max_workers} worker threads")
         print("Press Ctrl+C to stop the server")
         
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
             print("\nShutting down dashboard...")
-            httpd.shutdown() 
\ No newline at end of file
+            httpd.shutdown()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Overview fan-out load test for the Evil Space Dashboard
+
+Reproduces what each open browser tab does on the overview tab: fire the six
+overview API requests in parallel, wait for all of them, repeat. Reports
+throughput and latency so server changes can be compared under the real
+request pattern.
+
+Usage:
+    python benchmarks/overview_fanout.py --clients 4 --duration 20
+    python benchmarks/overview_fanout.py --interval 2   # realistic 2s refresh
+    python benchmarks/overview_fanout.py --batch        # one /api/batch call per round
+"""
+import argparse
+import statistics
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+OVERVIEW_ENDPOINTS = ['system', 'gpu', 'processes', 'network', 'logs', 'themes']
+
+def fetch(url, timeout):
+    """Fetch a URL and return (seconds, bytes received)"""
+    start = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        body = response.read()
+    return time.perf_counter() - start, len(body)
+
+def run_client(base_url, endpoints, deadline, interval, timeout, results, lock, batch=False):
+    """One simulated browser tab: parallel fan-out (or batched) rounds until the deadline"""
+    if batch:
+        urls = [f"{base_url}/api/batch?e={','.join(endpoints)}"]
+    else:
+        urls = [f"{base_url}/api/{endpoint}" for endpoint in endpoints]
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        while time.perf_counter() < deadline:
+            round_start = time.perf_counter()
+            futures = [pool.submit(fetch, url, timeout) for url in urls]
+
+            request_times = []
+            received = 0
+            errors = 0
+            for future in futures:
+                try:
+                    seconds, size = future.result()
+                    request_times.append(seconds)
+                    received += size
+                except Exception:
+                    errors += 1
+            round_time = time.perf_counter() - round_start
+
+            with lock:
+                results['rounds'].append(round_time)
+                results['requests'].extend(request_times)
+                results['bytes'] += received
+                results['errors'] += errors
+
+            if interval > 0:
+                time.sleep(max(0.0, interval - round_time))
+
+def probe_static(base_url, path, deadline, timeout, results, lock):
+    """Measure how long a non-API request waits while the fan-out is running"""
+    while time.perf_counter() < deadline:
+        try:
+            seconds, _ = fetch(f"{base_url}{path}", timeout)
+            with lock:
+                results['static'].append(seconds)
+        except Exception:
+            with lock:
+                results['errors'] += 1
+        time.sleep(0.25)
+
+def percentile(values, percent):
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def main():
+    parser = argparse.ArgumentParser(description="Overview fan-out load test for the dashboard")
+    parser.add_argument('--url', default='http://localhost:8080', help='Dashboard base URL')
+    parser.add_argument('--clients', type=int, default=2, help='Simulated browser tabs (default: 2)')
+    parser.add_argument('--duration', type=float, default=15.0, help='Test duration in seconds (default: 15)')
+    parser.add_argument('--interval', type=float, default=0.0,
+                        help='Seconds between rounds per client; 0 = back-to-back (default: 0)')
+    parser.add_argument('--endpoints', default=','.join(OVERVIEW_ENDPOINTS), help='Comma-separated API endpoints')
+    parser.add_argument('--batch', action='store_true', help='Fetch each round as a single /api/batch request')
+    parser.add_argument('--static-path', default='/', help='Non-API path probed for head-of-line blocking')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    endpoints = [e for e in args.endpoints.split(',') if e]
+    results = {'rounds': [], 'requests': [], 'static': [], 'bytes': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    threads = [
+        threading.Thread(target=run_client, args=(base_url, endpoints, deadline, args.interval, args.timeout, results, lock, args.batch))
+        for _ in range(args.clients)
+    ]
+    threads.append(threading.Thread(target=probe_static, args=(base_url, args.static_path, deadline, args.timeout, results, lock)))
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    rounds = results['rounds']
+    requests = results['requests']
+    static = results['static']
+    print(f"Clients: {args.clients}  Endpoints/round: {len(endpoints)}  Duration: {elapsed:.1f}s")
+    print(f"Rounds: {len(rounds)} ({len(rounds) / elapsed:.2f}/s)  Requests: {len(requests)} ({len(requests) / elapsed:.1f}/s)  Errors: {results['errors']}")
+    print(f"Received: {results['bytes'] / 1024:.1f} KiB ({results['bytes'] / max(1, len(requests)):.0f} B/request)")
+    for label, values in (('round', rounds), ('request', requests), ('static', static)):
+        if values:
+            print(f"{label:>8} latency  p50 {statistics.median(values) * 1000:8.1f} ms  "
+                  f"p95 {percentile(values, 95) * 1000:8.1f} ms  max {max(values) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Process table collection benchmark
+
+Times one full process table sample (status counts plus the top CPU and
+memory lists served by /api/processes) for each collector: the direct /proc
+reader, persistent psutil handles and the original per-request
+psutil.process_iter scan (when psutil is installed), and `ps aux`.
+Use --spawn to start idle child processes so the host has well over 1,000
+processes, where per-process overhead dominates.
+
+Usage:
+    python benchmarks/process_scan.py --rounds 20
+    python benchmarks/process_scan.py --spawn 1200 --rounds 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.api.process_table import ProcessTable, ProcProcessTable, summarize  # noqa: E402
+
+def ps_aux_sample():
+    """The previous fallback: run ps aux and parse its output"""
+    result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, timeout=5)
+    rows = []
+    for line in result.stdout.strip().split('\n')[1:]:
+        parts = line.split(None, 10)
+        if len(parts) >= 11:
+            rows.append({'pid': int(parts[1]), 'cpu_percent': float(parts[2]),
+                         'memory_percent': float(parts[3]), 'status': 'running'})
+    return summarize(rows)
+
+def psutil_iter_sample(psutil):
+    """The original psutil path: fresh process_iter objects and full sorts on every call"""
+    rows = []
+    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status', 'create_time', 'username']):
+        try:
+            info = proc.info
+            info['cpu_percent'] = proc.cpu_percent()
+            info['memory_mb'] = proc.memory_info().rss / 1024 / 1024
+            rows.append(info)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    sorted(rows, key=lambda x: x.get('cpu_percent') or 0, reverse=True)[:10]
+    sorted(rows, key=lambda x: x.get('memory_percent') or 0, reverse=True)[:10]
+    return len(rows), None, None, None
+
+def cpu_seconds():
+    """CPU seconds used by this process and its finished children"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+def run(name, sample, rounds, interval):
+    """Time `rounds` samples after one warm-up sample (which primes CPU deltas)"""
+    sample()
+    durations = []
+    cpu_before = cpu_seconds()
+    total = 0
+    for _ in range(rounds):
+        time.sleep(interval)
+        started = time.perf_counter()
+        total = sample()[0]
+        durations.append(time.perf_counter() - started)
+    cpu = cpu_seconds() - cpu_before
+    durations.sort()
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(f"{name:<16} {total:>9} {statistics.mean(durations) * 1000:>9.2f} "
+          f"{p95 * 1000:>9.2f} {cpu * 1000 / rounds:>11.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Process table collection benchmark")
+    parser.add_argument('--rounds', type=int, default=20, help='Timed samples per collector (default: 20)')
+    parser.add_argument('--interval', type=float, default=0.1, help='Seconds between samples (default: 0.1)')
+    parser.add_argument('--spawn', type=int, default=0, help='Idle child processes to start first')
+    args = parser.parse_args()
+
+    children = [subprocess.Popen(['sleep', '600']) for _ in range(args.spawn)]
+    try:
+        collectors = [('/proc', ProcProcessTable().sample)]
+        try:
+            import psutil
+            collectors.append(('psutil handles', ProcessTable(psutil).sample))
+            collectors.append(('psutil iter', lambda: psutil_iter_sample(psutil)))
+        except ImportError:
+            print("psutil not installed, skipping the psutil collectors")
+        collectors.append(('ps aux', ps_aux_sample))
+
+        print(f"{'collector':<16} {'processes':>9} {'mean ms':>9} {'p95 ms':>9} {'cpu ms/call':>11}")
+        for name, sample in collectors:
+            run(name, sample, args.rounds, args.interval)
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+if __name__ == "__main__":
+    main()
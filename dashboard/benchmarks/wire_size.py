@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Wire size and server CPU benchmark for the dashboard JSON API
+
+Polls each endpoint the way the page does and reports bytes on the wire per
+request for three client behaviours: plain (no compression, no validators),
+gzip (Accept-Encoding: gzip) and conditional (gzip + If-None-Match, as a
+browser revalidating its cache does). With --pid the server's CPU time for
+each phase is read from /proc/<pid>/stat.
+
+Usage:
+    python benchmarks/wire_size.py --rounds 20 --interval 1
+    python benchmarks/wire_size.py --pid $(pgrep -f evil_space_dashboard)
+"""
+import argparse
+import os
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_ENDPOINTS = ['system', 'gpu', 'processes', 'network', 'logs', 'themes', 'scripts']
+
+def server_cpu_seconds(pid):
+    """User + system CPU seconds consumed by a process so far"""
+    with open(f'/proc/{pid}/stat', 'r') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+def fetch(url, headers, timeout):
+    """Fetch a URL and return (status, body bytes as received, ETag)"""
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, len(response.read()), response.headers.get('ETag')
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, 0, e.headers.get('ETag')
+        raise
+
+def run_phase(base_url, endpoints, rounds, interval, timeout, gzip, conditional):
+    """Poll every endpoint `rounds` times; returns {endpoint: (bytes, not_modified)}"""
+    totals = {endpoint: [0, 0] for endpoint in endpoints}
+    etags = {}
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for endpoint in endpoints:
+            headers = {}
+            if gzip:
+                headers['Accept-Encoding'] = 'gzip'
+            if conditional and etags.get(endpoint):
+                headers['If-None-Match'] = etags[endpoint]
+            status, size, etag = fetch(f"{base_url}/api/{endpoint}", headers, timeout)
+            totals[endpoint][0] += size
+            totals[endpoint][1] += status == 304
+            if etag:
+                etags[endpoint] = etag
+        if interval > 0:
+            time.sleep(max(0.0, interval - (time.perf_counter() - started)))
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Wire size and server CPU benchmark for the dashboard API")
+    parser.add_argument('--url', default='http://localhost:8080', help='Dashboard base URL')
+    parser.add_argument('--endpoints', default=','.join(DEFAULT_ENDPOINTS), help='Comma-separated API endpoints')
+    parser.add_argument('--rounds', type=int, default=10, help='Polls per endpoint and phase (default: 10)')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between rounds (default: 1)')
+    parser.add_argument('--pid', type=int, help='Server PID, to report server CPU time per phase')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    endpoints = [e for e in args.endpoints.split(',') if e]
+    phases = (('plain', False, False), ('gzip', True, False), ('conditional', True, True))
+
+    results = {}
+    for name, gzip, conditional in phases:
+        cpu_before = server_cpu_seconds(args.pid) if args.pid else None
+        totals = run_phase(base_url, endpoints, args.rounds, args.interval, args.timeout, gzip, conditional)
+        cpu = server_cpu_seconds(args.pid) - cpu_before if args.pid else None
+        results[name] = (totals, cpu)
+
+    requests = args.rounds * len(endpoints)
+    print(f"Endpoints: {len(endpoints)}  Rounds: {args.rounds}  Interval: {args.interval}s")
+    print(f"{'endpoint':<12}" + ''.join(f"{name:>16}" for name, _, _ in phases) + '   (bytes/request, 304s)')
+    for endpoint in endpoints:
+        row = f"{endpoint:<12}"
+        for name, _, _ in phases:
+            size, not_modified = results[name][0][endpoint]
+            cell = f"{size / args.rounds:.0f} ({not_modified})"
+            row += f"{cell:>16}"
+        print(row)
+    for name, _, _ in phases:
+        totals, cpu = results[name]
+        received = sum(size for size, _ in totals.values())
+        line = f"{name:<12} total {received / 1024:9.1f} KiB  ({received / requests:.0f} B/request)"
+        if cpu is not None:
+            line += f"  server CPU {cpu * 1000:.0f} ms ({cpu * 1000 / requests:.2f} ms/request)"
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 """
 Evil Space Dashboard Runner
 """
+import os
 import sys
 from pathlib import Path
 
@@ -20,8 +21,18 @@ def main():
     # Create an instance of the main dashboard class
     dashboard_instance = EvilSpaceDashboard(dotfiles_path=str(dotfiles_path))
     
+    # Collect metrics in the background so API requests only read snapshots
+    dashboard_instance.start_sampler()
+    
+    # Keep a history of the sampled metrics in SQLite
+    dashboard_instance.start_recorder()
+    
     # Run the server with the instance
-    run_server(dashboard_instance)
+    try:
+        # EVIL_SPACE_DASHBOARD_RELOAD=1 rebuilds the page when the frontend source changes
+        run_server(dashboard_instance, reload_html=os.environ.get('EVIL_SPACE_DASHBOARD_RELOAD') == '1')
+    finally:
+        dashboard_instance.recorder.stop()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
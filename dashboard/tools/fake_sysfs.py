@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Fake sysfs tree for the GPU reader
+
+Builds a DRM directory laid out like /sys/class/drm on an amdgpu system and
+checks SysfsGpuReader and GpuInventory against it: VRAM reported in MB,
+temperature label selection, the power1_average -> power1_input fallback
+and cards or files that are missing. With --keep the tree is left on disk
+so a dashboard can be pointed at it (EvilSpaceDashboard(drm_root=...)).
+
+Usage:
+    python tools/fake_sysfs.py
+    python tools/fake_sysfs.py --keep /tmp/fake-drm
+"""
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.api.gpu_sysfs import GpuInventory, SysfsGpuReader, find_gpu_cards  # noqa: E402
+
+MB = 1024 * 1024
+
+DEFAULT_DEVICE = {
+    'gpu_busy_percent': '42',
+    'mem_info_vram_total': str(16368 * MB),
+    'mem_info_vram_used': str(2046 * MB),
+    'product_name': 'Radeon RX 7800 XT',
+    'device': '0x747e',
+}
+
+DEFAULT_HWMON = {
+    'temp1_label': 'edge',
+    'temp1_input': '48000',
+    'temp2_label': 'junction',
+    'temp2_input': '61000',
+    'temp3_label': 'mem',
+    'temp3_input': '70000',
+    'pwm1': '102',
+    'pwm1_max': '255',
+    'fan1_input': '1350',
+    'power1_average': '86000000',
+}
+
+def build_card(root, index, device=None, hwmon=None):
+    """Create cardN/device (and its hwmon0 unless hwmon is None); values override the defaults, None removes a file"""
+    device_path = Path(root) / f'card{index}' / 'device'
+    device_path.mkdir(parents=True, exist_ok=True)
+    _write_files(device_path, DEFAULT_DEVICE, device or {})
+    if hwmon is not None:
+        hwmon_path = device_path / 'hwmon' / 'hwmon0'
+        hwmon_path.mkdir(parents=True, exist_ok=True)
+        _write_files(hwmon_path, DEFAULT_HWMON, hwmon)
+    return device_path.parent
+
+def _write_files(directory, defaults, overrides):
+    for name, value in {**defaults, **overrides}.items():
+        if value is not None:
+            (directory / name).write_text(value + '\n')
+
+def read_card(root, **files):
+    """Build card0 from the given overrides and return the primary reader's metrics"""
+    build_card(root, 0, **files)
+    inventory = GpuInventory(root)
+    return inventory.reader().read()
+
+def check_vram_in_mb(root):
+    metrics = read_card(root, hwmon={})
+    assert metrics['available'] is True
+    assert metrics['usage'] == 42
+    assert (metrics['vram_used'], metrics['vram_total'], metrics['vram_percent']) == (2046, 16368, 12), metrics
+    assert metrics['power'] == 86.0 and metrics['fan_speed'] == 40 and metrics['fan_rpm'] == 1350, metrics
+
+def check_junction_temperature(root):
+    assert read_card(root, hwmon={})['temperature'] == 61.0
+
+def check_edge_temperature(root):
+    metrics = read_card(root, hwmon={'temp2_label': None, 'temp2_input': None})
+    assert metrics['temperature'] == 48.0, metrics
+
+def check_unlabelled_temperature(root):
+    metrics = read_card(root, hwmon={'temp1_label': None, 'temp2_label': None, 'temp3_label': None})
+    assert metrics['temperature'] == 48.0, metrics  # temp1_input
+
+def check_power_input_fallback(root):
+    metrics = read_card(root, hwmon={'power1_average': None, 'power1_input': '91500000'})
+    assert metrics['power'] == 91.5, metrics
+
+def check_missing_hwmon(root):
+    metrics = read_card(root)
+    assert metrics['available'] is True and metrics['usage'] == 42
+    assert all(metrics[key] is None for key in ('temperature', 'fan_speed', 'fan_rpm', 'power')), metrics
+
+def check_missing_vram_total(root):
+    metrics = read_card(root, device={'mem_info_vram_total': None}, hwmon={})
+    assert (metrics['vram_used'], metrics['vram_total'], metrics['vram_percent']) == (2046, None, None), metrics
+
+def check_unreadable_values(root):
+    metrics = read_card(root, device={'gpu_busy_percent': 'N/A'}, hwmon={'fan1_input': ''})
+    assert metrics['available'] is False and metrics['usage'] is None and metrics['fan_rpm'] is None, metrics
+
+def check_no_gpu(root):
+    build_card(root, 0, device={'gpu_busy_percent': None})  # e.g. an iGPU without utilisation
+    inventory = GpuInventory(root)
+    assert find_gpu_cards(root) == [] and inventory.primary is None and inventory.reader() is None
+    assert GpuInventory(Path(root) / 'missing').reader() is None
+
+def check_primary_card_and_hotplug(root):
+    build_card(root, 1, hwmon={})
+    build_card(root, 0, device={'gpu_busy_percent': None})
+    inventory = GpuInventory(root, check_interval=0)
+    assert inventory.primary.index == 1 and inventory.name() == 'Radeon RX 7800 XT'
+    build_card(root, 2, device={'gpu_busy_percent': '7'}, hwmon={})
+    assert inventory.refresh() is True and [d.index for d in inventory.devices] == [1, 2]
+    assert inventory.reader().read()['usage'] == 42
+
+def check_name_lookup_after_swap(root):
+    build_card(root, 0, device={'product_name': None}, hwmon={})
+    names = iter(['Radeon VII', 'Radeon RX 6600'])
+    inventory = GpuInventory(root, name_lookup=lambda: next(names), check_interval=0)
+    assert inventory.name() == 'Radeon VII' and inventory.name() == 'Radeon VII'
+    os.rename(Path(root) / 'card0', Path(root) / 'card1')  # e.g. a driver reload
+    assert inventory.refresh() is True and inventory.name() == 'Radeon RX 6600'
+
+def check_closed_reader(root):
+    build_card(root, 0, hwmon={})
+    reader = SysfsGpuReader(GpuInventory(root).primary)
+    reader.close()
+    assert reader.read()['available'] is False
+
+CHECKS = [
+    check_vram_in_mb,
+    check_junction_temperature,
+    check_edge_temperature,
+    check_unlabelled_temperature,
+    check_power_input_fallback,
+    check_missing_hwmon,
+    check_missing_vram_total,
+    check_unreadable_values,
+    check_no_gpu,
+    check_primary_card_and_hotplug,
+    check_name_lookup_after_swap,
+    check_closed_reader,
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the sysfs GPU reader against a fake DRM tree")
+    parser.add_argument('--keep', metavar='DIR', help='Only build a default card1 tree in DIR and keep it')
+    args = parser.parse_args()
+
+    if args.keep:
+        build_card(args.keep, 1, hwmon={})
+        print(f"Fake DRM tree written to {args.keep}")
+        return 0
+
+    failures = 0
+    for check in CHECKS:
+        with tempfile.TemporaryDirectory() as root:
+            try:
+                check(root)
+                print(f"ok    {check.__name__}")
+            except AssertionError as e:
+                failures += 1
+                print(f"FAIL  {check.__name__}: {e}")
+    print(f"{len(CHECKS) - failures}/{len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Checks for the backwards log tail reader
+
+Writes log files to a temporary directory and compares what
+_tail_matching_lines returns (read backwards in blocks) with a plain
+forward read of the whole file: lines spanning block boundaries, lines
+longer than TAIL_BLOCK_SIZE and TAIL_MAX_LINE_BYTES (cut to their end and
+marked, never spliced), level and search filters, and files without a
+trailing newline.
+
+Usage:
+    python tools/log_tail.py
+    python tools/log_tail.py --seed 7 --rounds 200
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.api import logs  # noqa: E402
+from app.api.logs import TAIL_TRUNCATED_MARKER, _line_matches, _tail_matching_lines  # noqa: E402
+
+def expected_tail(data, lines, filter_level=None, search_term=None):
+    """The same result from reading the whole file forwards"""
+    matched = []
+    for raw in data.split(b'\n'):
+        truncated = len(raw) > logs.TAIL_MAX_LINE_BYTES
+        if truncated:
+            raw = raw[-logs.TAIL_MAX_LINE_BYTES:]
+        line = raw.decode('utf-8', errors='ignore').strip()
+        if line and _line_matches(line, filter_level, search_term):
+            matched.append(TAIL_TRUNCATED_MARKER + line if truncated else line)
+    return matched[-lines:] if lines > 0 else matched
+
+def tail(root, data, lines, filter_level=None, search_term=None):
+    path = os.path.join(root, 'test.log')
+    with open(path, 'wb') as f:
+        f.write(data)
+    return _tail_matching_lines(path, lines, filter_level, search_term)[0]
+
+def check_long_line_is_not_spliced(root):
+    long_line = b'A' * 20 + b'B' * 100000 + b'C' * 100000
+    data = b'first ERROR\n' + long_line + b'\nlast INFO\n'
+    result = tail(root, data, 3)
+    assert result[0] == 'first ERROR' and result[2] == 'last INFO', result[::2]
+    kept = result[1]
+    assert kept.startswith(TAIL_TRUNCATED_MARKER), kept[:40]
+    body = kept[len(TAIL_TRUNCATED_MARKER):]
+    assert body == long_line[-logs.TAIL_MAX_LINE_BYTES:].decode(), (len(body), body[:10])
+    assert 'A' not in body
+
+def check_long_line_filters(root):
+    data = b'x ERROR\n' + b'y' * 300000 + b' ERROR\n' + b'z' * 200000 + b'\nlast ERROR'
+    assert tail(root, data, 10, 'ERROR') == expected_tail(data, 10, 'ERROR')
+    assert tail(root, data, 2, 'ERROR') == expected_tail(data, 2, 'ERROR')
+    assert tail(root, data, 10, None, 'zzz') == expected_tail(data, 10, None, 'zzz')
+
+def check_long_first_line(root):
+    data = b'Q' * 150000 + b'\nnext\n'
+    assert tail(root, data, 5) == expected_tail(data, 5)
+    data = b'Q' * 150000
+    assert tail(root, data, 5) == expected_tail(data, 5)
+
+def check_random(root, rng, rounds):
+    words = [b'INFO', b'ERROR', b'WARN', b'debug', b'needle', b'x', b'\xc3\xa9']
+    for _ in range(rounds):
+        lines = []
+        for _ in range(rng.randint(0, 60)):
+            length = rng.choice([0, 1, 10, 200, 70000, 140000])
+            lines.append(b' '.join(rng.choice(words) for _ in range(max(1, length // 5)))[:length])
+        data = b'\n'.join(lines) + rng.choice([b'', b'\n'])
+        wanted = rng.choice([0, 1, 5, 100])
+        filter_level = rng.choice([None, 'ALL', 'ERROR', 'WARNING'])
+        search_term = rng.choice([None, 'needle', 'é'])
+        result = tail(root, data, wanted, filter_level, search_term)
+        assert result == expected_tail(data, wanted, filter_level, search_term), (wanted, filter_level, search_term)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the backwards log tail reader")
+    parser.add_argument('--seed', type=int, default=1, help='Random seed (default: 1)')
+    parser.add_argument('--rounds', type=int, default=100, help='Random files to compare (default: 100)')
+    args = parser.parse_args()
+
+    checks = [
+        check_long_line_is_not_spliced,
+        check_long_line_filters,
+        check_long_first_line,
+        lambda root: check_random(root, random.Random(args.seed), args.rounds),
+    ]
+    names = [check.__name__ for check in checks[:-1]] + ['check_random']
+
+    failures = 0
+    for name, check in zip(names, checks):
+        with tempfile.TemporaryDirectory() as root:
+            try:
+                check(root)
+                print(f"ok    {name}")
+            except AssertionError as e:
+                failures += 1
+                print(f"FAIL  {name}: {str(e)[:200]}")
+    print(f"{len(checks) - failures}/{len(checks)} checks passed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,14 +5,11 @@ import json
 import subprocess
 import sys
 import threading
-from datetime import datetime, timedelta
-
-import pytz
 
 from usage_analyzer.api import analyze_usage
-
-# All internal calculations use UTC, display timezone is configurable
-UTC_TZ = pytz.UTC
+from usage_analyzer.core.limits import CUSTOM_PLANS, PlanLimitTracker, get_plan_limit
+from usage_analyzer.utils.timestamps import MS_PER_HOUR, MS_PER_MINUTE, now_ms, parse_timestamp_ms
+from usage_analyzer.utils.timezones import DEFAULT_TIMEZONE, DisplayTimezone
 
 # Notification persistence configuration
 NOTIFICATION_MIN_DURATION = 5  # seconds - minimum time to display notifications
@@ -37,7 +34,7 @@ def update_notification_state(notification_type, condition_met, current_time):
     else:
         if state['triggered']:
             # Check if minimum duration has passed
-            elapsed = (current_time - state['timestamp']).total_seconds()
+            elapsed = (current_time - state['timestamp']) / 1000
             if elapsed >= NOTIFICATION_MIN_DURATION:
                 # Reset state after minimum duration
                 state['triggered'] = False
@@ -155,11 +152,14 @@ def get_velocity_indicator(burn_rate):
 
 
 def calculate_hourly_burn_rate(blocks, current_time):
-    """Calculate burn rate based on all sessions in the last hour."""
+    """Calculate burn rate based on all sessions in the last hour.
+
+    current_time and all block times are integer epoch milliseconds (UTC).
+    """
     if not blocks:
         return 0
 
-    one_hour_ago = current_time - timedelta(hours=1)
+    one_hour_ago = current_time - MS_PER_HOUR
     total_tokens = 0
 
     for block in blocks:
@@ -167,18 +167,13 @@ def calculate_hourly_burn_rate(blocks, current_time):
         if not start_time_str:
             continue
 
-        # Parse start time - data from usage_analyzer is in UTC
-        start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-        # Ensure it's in UTC for calculations
-        if start_time.tzinfo is None:
-            start_time = UTC_TZ.localize(start_time)
-        else:
-            start_time = start_time.astimezone(UTC_TZ)
-
         # Skip gaps
         if block.get("isGap", False):
             continue
 
+        # Parse start time - data from usage_analyzer is in UTC
+        start_time = parse_timestamp_ms(start_time_str)
+
         # Determine session end time
         if block.get("isActive", False):
             # For active sessions, use current time
@@ -187,14 +182,7 @@ def calculate_hourly_burn_rate(blocks, current_time):
             # For completed sessions, use actualEndTime or current time
             actual_end_str = block.get("actualEndTime")
             if actual_end_str:
-                session_actual_end = datetime.fromisoformat(
-                    actual_end_str.replace("Z", "+00:00")
-                )
-                # Ensure it's in UTC for calculations
-                if session_actual_end.tzinfo is None:
-                    session_actual_end = UTC_TZ.localize(session_actual_end)
-                else:
-                    session_actual_end = session_actual_end.astimezone(UTC_TZ)
+                session_actual_end = parse_timestamp_ms(actual_end_str)
             else:
                 session_actual_end = current_time
 
@@ -211,12 +199,8 @@ def calculate_hourly_burn_rate(blocks, current_time):
             continue
 
         # Calculate portion of tokens used in the last hour
-        total_session_duration = (
-            session_actual_end - start_time
-        ).total_seconds() / 60  # minutes
-        hour_duration = (
-            session_end_in_hour - session_start_in_hour
-        ).total_seconds() / 60  # minutes
+        total_session_duration = session_actual_end - start_time  # ms
+        hour_duration = session_end_in_hour - session_start_in_hour  # ms
 
         if total_session_duration > 0:
             session_tokens = block.get("totalTokens", 0)
@@ -229,6 +213,7 @@ def calculate_hourly_burn_rate(blocks, current_time):
 
 
 
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -238,8 +223,9 @@ def parse_args():
         "--plan",
         type=str,
         default="pro",
-        choices=["pro", "max5", "max20", "custom_max"],
-        help='Claude plan type (default: pro). Use "custom_max" to auto-detect from highest previous block',
+        choices=["pro", "max5", "max20", *CUSTOM_PLANS],
+        help='Claude plan type (default: pro). Use "custom_max" to auto-detect from highest previous block, '
+        'or "custom_p95"/"custom_p99" for a percentile of previous blocks',
     )
     parser.add_argument(
         "--reset-hour", type=int, help="Change the reset hour (0-23) for daily limits"
@@ -247,27 +233,21 @@ def parse_args():
     parser.add_argument(
         "--timezone",
         type=str,
-        default="Europe/Warsaw",
-        help="Timezone for reset times (default: Europe/Warsaw). Examples: US/Eastern, Asia/Tokyo, UTC",
+        default=DEFAULT_TIMEZONE,
+        help=f"Timezone for reset times (default: {DEFAULT_TIMEZONE}). Examples: US/Eastern, Asia/Tokyo, UTC",
     )
     return parser.parse_args()
 
 
-def get_token_limit(plan, blocks=None):
-    # TODO calculate old based on limits
-    limits = {"pro": 44000, "max5": 220000, "max20": 880000}
+def get_token_limit(plan, tracker=None):
+    """Get token limit based on plan type.
 
-    """Get token limit based on plan type."""
-    if plan == "custom_max" and blocks:
-        max_tokens = 0
-        for block in blocks:
-            if not block.get("isGap", False) and not block.get("isActive", False):
-                tokens = block.get("totalTokens", 0)
-                if tokens > max_tokens:
-                    max_tokens = tokens
-        return max_tokens if max_tokens > 0 else limits["pro"]
-
-    return limits.get(plan, 44000)
+    Custom plans are calibrated from the finalized block history kept by the
+    tracker, so reading a limit does not rescan blocks.
+    """
+    if tracker is not None:
+        return tracker.get_limit(plan)
+    return get_plan_limit(plan)
 
 
 def setup_terminal():
@@ -328,15 +308,23 @@ def main():
     # Setup terminal to prevent input interference
     old_terminal_settings = setup_terminal()
 
-    # For 'custom_max' plan, we need to get data first to determine the limit
-    if args.plan == "custom_max":
+    # Internal times are UTC epoch milliseconds; the display timezone is resolved
+    # once here and unknown names fall back to the default
+    display_tz = DisplayTimezone(args.timezone)
+
+    # Finalized block totals persist across runs, so custom limits are O(1) reads
+    limit_tracker = PlanLimitTracker()
+
+    # For custom plans, we need to get data first to determine the limit
+    if args.plan in CUSTOM_PLANS:
         print(
-            f"{cyan}Fetching initial data to determine custom max token limit...{reset}"
+            f"{cyan}Fetching initial data to determine {args.plan} token limit...{reset}"
         )
         initial_data = analyze_usage()
         if initial_data and "blocks" in initial_data:
-            token_limit = get_token_limit(args.plan, initial_data["blocks"])
-            print(f"{cyan}Custom max token limit detected: {token_limit:,}{reset}")
+            limit_tracker.update(initial_data["blocks"])
+            token_limit = get_token_limit(args.plan, limit_tracker)
+            print(f"{cyan}Custom token limit detected: {token_limit:,}{reset}")
         else:
             token_limit = get_token_limit("pro")  # Fallback to pro
             print(
@@ -404,12 +392,7 @@ def main():
                 )
                 screen_buffer.append("")
                 # Use configured timezone for time display
-                try:
-                    display_tz = pytz.timezone(args.timezone)
-                except pytz.exceptions.UnknownTimeZoneError:
-                    display_tz = pytz.timezone("Europe/Warsaw")
-                current_time_display = datetime.now(UTC_TZ).astimezone(display_tz)
-                current_time_str = current_time_display.strftime("%H:%M:%S")
+                current_time_str = display_tz.strftime(now_ms(), "%H:%M:%S")
                 screen_buffer.append(
                     "⏰ \033[90m{}\033[0m 📝 \033[96mNo active session\033[0m | \033[90mCtrl+C to exit\033[0m 🟨".format(
                         current_time_str
@@ -424,14 +407,18 @@ def main():
 
             # Extract data from active block
             tokens_used = active_block.get("totalTokens", 0)
+
+            # Record blocks finalized since the last refresh
+            if limit_tracker.update(data["blocks"]) and args.plan in CUSTOM_PLANS:
+                token_limit = get_token_limit(args.plan, limit_tracker)
             
             # Store original limit for notification
             original_limit = get_token_limit(args.plan)
 
             # Check if tokens exceed limit and switch to custom_max if needed
-            if tokens_used > token_limit and args.plan != "custom_max":
+            if tokens_used > token_limit and args.plan not in CUSTOM_PLANS:
                 # Auto-switch to custom_max when any plan limit is exceeded
-                new_limit = get_token_limit("custom_max", data["blocks"])
+                new_limit = get_token_limit("custom_max", limit_tracker)
                 if new_limit > token_limit:
                     token_limit = new_limit
 
@@ -440,49 +427,31 @@ def main():
             )
             tokens_left = token_limit - tokens_used
 
-            # Time calculations - all internal calculations in UTC
+            # Time calculations - all internal calculations in UTC epoch milliseconds
+            current_time = now_ms()
+
             start_time_str = active_block.get("startTime")
             if start_time_str:
-                start_time = datetime.fromisoformat(
-                    start_time_str.replace("Z", "+00:00")
-                )
-                # Ensure start_time is in UTC
-                if start_time.tzinfo is None:
-                    start_time = UTC_TZ.localize(start_time)
-                else:
-                    start_time = start_time.astimezone(UTC_TZ)
+                start_time = parse_timestamp_ms(start_time_str)
             
             # Extract endTime from active block (comes in UTC from usage_analyzer)
             end_time_str = active_block.get("endTime")
             if end_time_str:
-                reset_time = datetime.fromisoformat(
-                    end_time_str.replace("Z", "+00:00")
-                )
-                # Ensure reset_time is in UTC
-                if reset_time.tzinfo is None:
-                    reset_time = UTC_TZ.localize(reset_time)
-                else:
-                    reset_time = reset_time.astimezone(UTC_TZ)
+                reset_time = parse_timestamp_ms(end_time_str)
             else:
                 # Fallback: if no endTime, estimate 5 hours from startTime
-                reset_time = start_time + timedelta(hours=5) if start_time_str else datetime.now(UTC_TZ) + timedelta(hours=5)
-            
-            # Always use UTC for internal calculations
-            current_time = datetime.now(UTC_TZ)
+                reset_time = (start_time if start_time_str else current_time) + 5 * MS_PER_HOUR
 
             # Calculate burn rate from ALL sessions in the last hour
             burn_rate = calculate_hourly_burn_rate(data["blocks"], current_time)
 
             # Calculate time to reset
-            time_to_reset = reset_time - current_time
-            minutes_to_reset = time_to_reset.total_seconds() / 60
+            minutes_to_reset = (reset_time - current_time) / MS_PER_MINUTE
 
             # Predicted end calculation - when tokens will run out based on burn rate
             if burn_rate > 0 and tokens_left > 0:
                 minutes_to_depletion = tokens_left / burn_rate
-                predicted_end_time = current_time + timedelta(
-                    minutes=minutes_to_depletion
-                )
+                predicted_end_time = current_time + int(minutes_to_depletion * MS_PER_MINUTE)
             else:
                 # If no burn rate or tokens already depleted, use reset time
                 predicted_end_time = reset_time
@@ -499,8 +468,8 @@ def main():
             # Time to Reset section - calculate progress based on actual session duration
             if start_time_str and end_time_str:
                 # Calculate actual session duration and elapsed time
-                total_session_minutes = (reset_time - start_time).total_seconds() / 60
-                elapsed_session_minutes = (current_time - start_time).total_seconds() / 60
+                total_session_minutes = (reset_time - start_time) / MS_PER_MINUTE
+                elapsed_session_minutes = (current_time - start_time) / MS_PER_MINUTE
                 elapsed_session_minutes = max(0, elapsed_session_minutes)  # Ensure non-negative
             else:
                 # Fallback to 5 hours if times not available
@@ -522,15 +491,8 @@ def main():
             screen_buffer.append("")
 
             # Predictions - convert to configured timezone for display
-            try:
-                local_tz = pytz.timezone(args.timezone)
-            except pytz.exceptions.UnknownTimeZoneError:
-                local_tz = pytz.timezone("Europe/Warsaw")
-            predicted_end_local = predicted_end_time.astimezone(local_tz)
-            reset_time_local = reset_time.astimezone(local_tz)
-
-            predicted_end_str = predicted_end_local.strftime("%H:%M")
-            reset_time_str = reset_time_local.strftime("%H:%M")
+            predicted_end_str = display_tz.strftime(predicted_end_time, "%H:%M")
+            reset_time_str = display_tz.strftime(reset_time, "%H:%M")
             screen_buffer.append(f"🏁 {white}Predicted End:{reset} {predicted_end_str}")
             screen_buffer.append(f"🔄 {white}Token Reset:{reset}   {reset_time_str}")
             screen_buffer.append("")
@@ -566,12 +528,7 @@ def main():
                 screen_buffer.append("")
 
             # Status line - use configured timezone for consistency
-            try:
-                display_tz = pytz.timezone(args.timezone)
-            except pytz.exceptions.UnknownTimeZoneError:
-                display_tz = pytz.timezone("Europe/Warsaw")
-            current_time_display = datetime.now(UTC_TZ).astimezone(display_tz)
-            current_time_str = current_time_display.strftime("%H:%M:%S")
+            current_time_str = display_tz.strftime(now_ms(), "%H:%M:%S")
             screen_buffer.append(
                 f"⏰ {gray}{current_time_str}{reset} 📝 {cyan}Smooth sailing...{reset} | {gray}Ctrl+C to exit{reset} 🟨"
             )
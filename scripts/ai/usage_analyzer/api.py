@@ -8,45 +8,62 @@ with only the essential functionality needed.
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from usage_analyzer.core.data_loader import DataLoader
 from usage_analyzer.core.identifier import SessionBlockIdentifier
 from usage_analyzer.core.calculator import BurnRateCalculator
 from usage_analyzer.output.json_formatter import JSONFormatter
 from usage_analyzer.utils.path_discovery import discover_claude_data_paths
+from usage_analyzer.utils.instrumentation import Instrumentation
 from usage_analyzer.models.data_structures import CostMode
 
 
-def analyze_usage():
-    """Main entry point to generate response_final.json."""
-
-    data_loader = DataLoader()
-    identifier = SessionBlockIdentifier(session_duration_hours=5)
-    calculator = BurnRateCalculator()
-    formatter = JSONFormatter()
-
-    # Load usage data from Claude directories (using AUTO mode by default)
-    # print("Loading usage data...")
-    entries = data_loader.load_usage_data(mode=CostMode.AUTO)
-    # print(f"Loaded {len(entries)} usage entries")
-
-    # Identify session blocks
-    # print("Identifying session blocks...")
-    blocks = identifier.identify_blocks(entries)
-
-    for block in blocks:
-        if block.is_active:
-            burn_rate = calculator.calculate_burn_rate(block)
-            if burn_rate:
-                block.burn_rate_snapshot = burn_rate
-                projection = calculator.project_block_usage(block)
-                if projection:
-                    block.projection_data = {
-                        "totalTokens": projection.projected_total_tokens,
-                        "totalCost": projection.projected_total_cost,
-                        "remainingMinutes": projection.remaining_minutes
-                    }
-
-    json_output = formatter.format_blocks(blocks)
-#
-    return json.loads(json_output)
+def analyze_usage(data_path: Optional[str] = None, instrument: Optional[bool] = None):
+    """Main entry point to generate response_final.json.
+
+    Args:
+        data_path: Claude projects directory to read (auto-discovered if None)
+        instrument: Record per-stage timings and counters; None defers to the
+            CLAUDE_USAGE_PROFILE environment variable. When enabled, the result
+            gains an "instrumentation" key and a summary line goes to stderr.
+    """
+    instrumentation = Instrumentation.from_env(instrument)
+
+    with instrumentation.stage("total"):
+        data_loader = DataLoader(data_path, instrumentation=instrumentation)
+        identifier = SessionBlockIdentifier(session_duration_hours=5)
+        calculator = BurnRateCalculator()
+        formatter = JSONFormatter()
+
+        # Load usage data from Claude directories (using AUTO mode by default)
+        entries = data_loader.load_usage_data(mode=CostMode.AUTO)
+
+        # Identify session blocks
+        with instrumentation.stage("blocks"):
+            blocks = identifier.identify_blocks(entries)
+        instrumentation.count("blocks", len(blocks))
+
+        with instrumentation.stage("burn_rate"):
+            for block in blocks:
+                if block.is_active:
+                    burn_rate = calculator.calculate_burn_rate(block)
+                    if burn_rate:
+                        block.burn_rate_snapshot = burn_rate
+                        projection = calculator.project_block_usage(block)
+                        if projection:
+                            block.projection_data = {
+                                "totalTokens": projection.projected_total_tokens,
+                                "totalCost": projection.projected_total_cost,
+                                "remainingMinutes": projection.remaining_minutes
+                            }
+
+        with instrumentation.stage("formatting"):
+            json_output = formatter.format_blocks(blocks)
+            result = json.loads(json_output)
+
+    if instrumentation.enabled:
+        result["instrumentation"] = instrumentation.to_dict()
+        instrumentation.emit()
+
+    return result
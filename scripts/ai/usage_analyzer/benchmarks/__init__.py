@@ -0,0 +1,6 @@
+"""Benchmarks and synthetic data for Claude Usage Analyzer."""
+
+__all__ = [
+    "corpus",
+    "harness",
+]
@@ -0,0 +1,218 @@
+"""
+Synthetic Claude Project Corpus Generator
+
+Writes deterministic Claude project trees (projects/<project>/<session>.jsonl)
+that look like real Claude Code transcripts: mixed models, user turns with
+large tool outputs, and duplicated message/request ids from resumed sessions.
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Relative weights of models seen in real transcripts
+MODEL_WEIGHTS = [
+    ("claude-sonnet-4-20250514", 60),
+    ("claude-opus-4-20250514", 25),
+    ("claude-3-5-haiku-20241022", 10),
+    ("<synthetic>", 5),
+]
+
+MANIFEST_NAME = "corpus.json"
+CORPUS_START = datetime(2025, 5, 1, 8, 0, 0, tzinfo=timezone.utc)
+
+
+class CorpusGenerator:
+    """Deterministic generator for synthetic Claude usage JSONL trees."""
+
+    def __init__(self,
+                 seed: int = 1337,
+                 entries_per_file: int = 500,
+                 files_per_project: int = 20,
+                 duplicate_rate: float = 0.05,
+                 tool_output_rate: float = 0.3,
+                 tool_output_bytes: int = 16384):
+        """Initialize generator settings.
+
+        Args:
+            seed: Random seed; the same settings always produce identical trees
+            entries_per_file: Average number of JSONL lines per session file
+            files_per_project: Number of session files per project directory
+            duplicate_rate: Fraction of assistant lines re-emitted with the same ids
+            tool_output_rate: Fraction of user lines carrying a tool result
+            tool_output_bytes: Maximum size of a tool result payload
+        """
+        self.seed = seed
+        self.entries_per_file = entries_per_file
+        self.files_per_project = files_per_project
+        self.duplicate_rate = duplicate_rate
+        self.tool_output_rate = tool_output_rate
+        self.tool_output_bytes = tool_output_bytes
+
+        self._models = [model for model, _ in MODEL_WEIGHTS]
+        self._model_weights = [weight for _, weight in MODEL_WEIGHTS]
+
+    def generate(self, output_dir: str, total_entries: int) -> Dict[str, Any]:
+        """Write a corpus with roughly total_entries lines and return its manifest."""
+        rng = random.Random(self.seed)
+        root = Path(output_dir).expanduser()
+        root.mkdir(parents=True, exist_ok=True)
+
+        clock = CORPUS_START
+        written = 0
+        duplicates = 0
+        files = 0
+        recent_assistant: List[str] = []
+
+        while written < total_entries:
+            project_dir = root / f"-home-user-project-{files // self.files_per_project:04d}"
+            project_dir.mkdir(exist_ok=True)
+            session_id = str(uuid.UUID(int=rng.getrandbits(128)))
+
+            lines_in_file = min(
+                total_entries - written,
+                max(1, int(rng.gauss(self.entries_per_file, self.entries_per_file / 4)))
+            )
+
+            with open(project_dir / f"{session_id}.jsonl", "w", encoding="utf-8") as f:
+                for _ in range(lines_in_file):
+                    clock = self._advance_clock(rng, clock)
+
+                    if recent_assistant and rng.random() < self.duplicate_rate:
+                        # Resumed sessions replay earlier assistant messages verbatim
+                        f.write(rng.choice(recent_assistant))
+                        duplicates += 1
+                    elif rng.random() < 0.5:
+                        line = self._assistant_line(rng, clock, session_id)
+                        recent_assistant.append(line)
+                        if len(recent_assistant) > 256:
+                            recent_assistant.pop(0)
+                        f.write(line)
+                    else:
+                        f.write(self._user_line(rng, clock, session_id))
+                    written += 1
+
+            files += 1
+
+        manifest = {
+            "seed": self.seed,
+            "entries": written,
+            "duplicates": duplicates,
+            "files": files,
+            "entriesPerFile": self.entries_per_file,
+            "duplicateRate": self.duplicate_rate,
+            "toolOutputRate": self.tool_output_rate,
+            "toolOutputBytes": self.tool_output_bytes,
+        }
+        with open(root / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        return manifest
+
+    def _advance_clock(self, rng: random.Random, clock: datetime) -> datetime:
+        """Move time forward with bursts of activity and occasional long breaks."""
+        roll = rng.random()
+        if roll < 0.001:
+            # Overnight / multi-day break creates gap blocks
+            return clock + timedelta(hours=rng.uniform(6, 40))
+        if roll < 0.01:
+            return clock + timedelta(minutes=rng.uniform(20, 120))
+        return clock + timedelta(seconds=rng.uniform(1, 45), milliseconds=rng.randint(0, 999))
+
+    def _timestamp(self, clock: datetime) -> str:
+        """Format a timestamp exactly like Claude Code transcripts."""
+        return clock.strftime("%Y-%m-%dT%H:%M:%S.") + f"{clock.microsecond // 1000:03d}Z"
+
+    def _assistant_line(self, rng: random.Random, clock: datetime, session_id: str) -> str:
+        """Build an assistant message line carrying token usage."""
+        model = rng.choices(self._models, weights=self._model_weights)[0]
+        synthetic = model == "<synthetic>"
+        record = {
+            "parentUuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            "isSidechain": False,
+            "userType": "external",
+            "cwd": "/home/user/project",
+            "sessionId": session_id,
+            "version": "1.0.35",
+            "type": "assistant",
+            "message": {
+                "id": f"msg_{rng.getrandbits(96):024x}",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": "x" * rng.randint(20, 600)}],
+                "stop_reason": "end_turn" if rng.random() < 0.3 else "tool_use",
+                "usage": {
+                    "input_tokens": 0 if synthetic else rng.randint(1, 400),
+                    "cache_creation_input_tokens": 0 if synthetic else rng.randint(0, 8000),
+                    "cache_read_input_tokens": 0 if synthetic else rng.randint(0, 60000),
+                    "output_tokens": 0 if synthetic else rng.randint(1, 2000),
+                    "service_tier": "standard",
+                },
+            },
+            "requestId": f"req_{rng.getrandbits(96):024x}",
+            "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            "timestamp": self._timestamp(clock),
+        }
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+    def _user_line(self, rng: random.Random, clock: datetime, session_id: str) -> str:
+        """Build a user line, sometimes carrying a large tool output."""
+        if rng.random() < self.tool_output_rate:
+            content = [{
+                "tool_use_id": f"toolu_{rng.getrandbits(96):024x}",
+                "type": "tool_result",
+                "content": "line of tool output\n" * (rng.randint(1, self.tool_output_bytes) // 20),
+            }]
+        else:
+            content = "y" * rng.randint(10, 400)
+
+        record = {
+            "parentUuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            "isSidechain": False,
+            "userType": "external",
+            "cwd": "/home/user/project",
+            "sessionId": session_id,
+            "version": "1.0.35",
+            "type": "user",
+            "message": {"role": "user", "content": content},
+            "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            "timestamp": self._timestamp(clock),
+        }
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def load_manifest(corpus_dir: str) -> Dict[str, Any]:
+    """Read the manifest of a generated corpus (empty dict if missing)."""
+    try:
+        with open(Path(corpus_dir).expanduser() / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    """Command line entry point: python -m usage_analyzer.benchmarks.corpus"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Claude usage corpus")
+    parser.add_argument("output_dir", help="Directory to write the project tree into")
+    parser.add_argument("--entries", type=int, default=10000, help="Total JSONL lines (default: 10000)")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed (default: 1337)")
+    parser.add_argument("--entries-per-file", type=int, default=500, help="Average lines per file")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05, help="Fraction of duplicated lines")
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(
+        seed=args.seed,
+        entries_per_file=args.entries_per_file,
+        duplicate_rate=args.duplicate_rate,
+    )
+    manifest = generator.generate(args.output_dir, args.entries)
+    print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Usage Analyzer Benchmark Harness
+
+Times DataLoader, SessionBlockIdentifier, JSONFormatter and the end-to-end
+analyze_usage against synthetic corpora, reports peak memory, and compares
+results with a saved baseline.
+
+Usage:
+    python -m usage_analyzer.benchmarks.harness --sizes 10k,100k
+    python -m usage_analyzer.benchmarks.harness --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from usage_analyzer.api import analyze_usage
+from usage_analyzer.benchmarks.corpus import CorpusGenerator, load_manifest
+from usage_analyzer.core.data_loader import DataLoader
+from usage_analyzer.core.identifier import SessionBlockIdentifier
+from usage_analyzer.models.data_structures import CostMode
+from usage_analyzer.output.json_formatter import JSONFormatter
+
+DEFAULT_SIZES = "10k,100k,1m"
+STAGES = ["data_loader", "identifier", "formatter", "analyze_usage"]
+
+
+def default_bench_dir() -> Path:
+    """Directory holding generated corpora and the saved baseline."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or "~/.cache"
+    return Path(cache_home).expanduser() / "claude-usage" / "bench"
+
+
+def parse_size(size: str) -> int:
+    """Parse sizes like '10k', '1m' or '250000'."""
+    size = size.strip().lower()
+    multipliers = {"k": 1000, "m": 1000000}
+    if size and size[-1] in multipliers:
+        return int(float(size[:-1]) * multipliers[size[-1]])
+    return int(size)
+
+
+def ensure_corpus(bench_dir: Path, entries: int, seed: int) -> Path:
+    """Generate the corpus for a size unless an identical one already exists."""
+    corpus_dir = bench_dir / f"corpus-{entries}-{seed}"
+    manifest = load_manifest(str(corpus_dir))
+    if manifest.get("entries") == entries and manifest.get("seed") == seed:
+        return corpus_dir
+
+    print(f"Generating {entries:,} entry corpus in {corpus_dir}...", file=sys.stderr)
+    CorpusGenerator(seed=seed).generate(str(corpus_dir), entries)
+    return corpus_dir
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> Tuple[Any, Dict[str, float]]:
+    """Run func `repeat` times for best wall time, then once more under tracemalloc."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Memory is measured separately since tracemalloc slows execution down
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, {"seconds": best, "peak_mb": peak / 1024 / 1024}
+
+
+def run_size(corpus_dir: Path, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark every stage against one corpus."""
+    results = {}
+
+    entries, results["data_loader"] = _measure(
+        lambda: DataLoader(str(corpus_dir)).load_usage_data(mode=CostMode.AUTO), repeat
+    )
+    blocks, results["identifier"] = _measure(
+        lambda: SessionBlockIdentifier(session_duration_hours=5).identify_blocks(entries), repeat
+    )
+    _, results["formatter"] = _measure(lambda: JSONFormatter().format_blocks(blocks), repeat)
+    _, results["analyze_usage"] = _measure(lambda: analyze_usage(str(corpus_dir)), repeat)
+
+    results["data_loader"]["entries"] = len(entries)
+    results["identifier"]["blocks"] = len(blocks)
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table and return the list of regressions."""
+    regressions = []
+    print(f"\n{'size':>10} {'stage':<14} {'time':>10} {'base':>10} {'ratio':>7} {'peak MB':>9} {'base MB':>9}")
+    for size, stages in results.items():
+        for stage in STAGES:
+            current = stages[stage]
+            base = baseline.get(size, {}).get(stage)
+            if not base:
+                print(f"{size:>10} {stage:<14} {current['seconds']:>9.3f}s {'-':>10} {'-':>7} "
+                      f"{current['peak_mb']:>9.1f} {'-':>9}")
+                continue
+
+            ratio = current["seconds"] / base["seconds"] if base["seconds"] else 0.0
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = " !"
+                regressions.append(f"{size} {stage}: {ratio:.2f}x slower")
+            print(f"{size:>10} {stage:<14} {current['seconds']:>9.3f}s {base['seconds']:>9.3f}s "
+                  f"{ratio:>6.2f}x {current['peak_mb']:>9.1f} {base['peak_mb']:>9.1f}{flag}")
+    return regressions
+
+
+def main():
+    """Command line entry point: python -m usage_analyzer.benchmarks.harness"""
+    parser = argparse.ArgumentParser(description="Benchmark the Claude usage analyzer")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Corpus sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage, best is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=1337, help="Corpus seed (default: 1337)")
+    parser.add_argument("--bench-dir", default=None, help="Corpus/baseline directory (default: ~/.cache/claude-usage/bench)")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown before flagging (default: 0.10)")
+    args = parser.parse_args()
+
+    bench_dir = Path(args.bench_dir).expanduser() if args.bench_dir else default_bench_dir()
+    baseline_path = Path(args.baseline).expanduser() if args.baseline else bench_dir / "baseline.json"
+
+    results = {}
+    for size in args.sizes.split(","):
+        entries = parse_size(size)
+        corpus_dir = ensure_corpus(bench_dir, entries, args.seed)
+        print(f"Benchmarking {entries:,} entries...", file=sys.stderr)
+        results[str(entries)] = run_size(corpus_dir, args.repeat)
+
+    try:
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        bench_dir.mkdir(parents=True, exist_ok=True)
+        baseline.update(results)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline saved to {baseline_path}")
+    elif regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,4 +4,5 @@ __all__ = [
     "identifier",
     "calculator",
     "filtering",
+    "limits",
 ]
\ No newline at end of file
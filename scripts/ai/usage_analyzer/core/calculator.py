@@ -4,10 +4,10 @@ Simplified Burn Rate Calculator
 Basic calculator for token consumption rates and usage projections.
 """
 
-from datetime import datetime, timezone
 from typing import Optional
 
 from usage_analyzer.models.data_structures import SessionBlock, BurnRate, UsageProjection
+from usage_analyzer.utils.timestamps import now_ms
 
 
 class BurnRateCalculator:
@@ -39,8 +39,7 @@ class BurnRateCalculator:
             return None
         
         # Calculate remaining time
-        now = datetime.now(timezone.utc)
-        remaining_seconds = (block.end_time - now).total_seconds()
+        remaining_seconds = (block.end_time - now_ms()) / 1000
         
         if remaining_seconds <= 0:
             return None
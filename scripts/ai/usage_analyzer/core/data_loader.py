@@ -4,20 +4,22 @@ Simplified Data Loading for Claude Usage Analysis
 Basic data loader that parses Claude usage data from JSONL files.
 """
 
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 import json
+import time
 
 from usage_analyzer.utils.path_discovery import discover_claude_data_paths
 from usage_analyzer.utils.pricing_fetcher import ClaudePricingFetcher
+from usage_analyzer.utils.instrumentation import Instrumentation
+from usage_analyzer.utils.timestamps import parse_timestamp_ms
 from usage_analyzer.models.data_structures import UsageEntry, CostMode
 
 
 class DataLoader:
     """Simplified data loading component for Claude usage data."""
     
-    def __init__(self, data_path: Optional[str] = None):
+    def __init__(self, data_path: Optional[str] = None, instrumentation: Optional[Instrumentation] = None):
         """Initialize the data loader."""
         if data_path is None:
             # Auto-discover
@@ -27,11 +29,16 @@ class DataLoader:
             self.data_path = Path(data_path).expanduser()
         
         self.pricing_fetcher = ClaudePricingFetcher()
+        self.instrumentation = instrumentation or Instrumentation()
 
     def load_usage_data(self, mode: CostMode = CostMode.AUTO) -> List[UsageEntry]:
         """Load and process all usage data."""
+        instrumentation = self.instrumentation
+
         # Find JSONL files
-        jsonl_files = self._find_jsonl_files()
+        with instrumentation.stage("discovery"):
+            jsonl_files = self._find_jsonl_files()
+        instrumentation.count("files", len(jsonl_files))
         
         if not jsonl_files:
             return []
@@ -40,21 +47,15 @@ class DataLoader:
         # Track processed message+request combinations for deduplication
         processed_hashes = set()
         
-        # Track overall statistics
-        total_files = len(jsonl_files)
-        total_processed = 0
-        
-        # Process each file
-        for file_path in jsonl_files:
-            entries = self._parse_jsonl_file(file_path, processed_hashes, mode)
-            all_entries.extend(entries)
-            total_processed += 1
-        
-        # print(f"Loaded {len(all_entries)} entries from {total_processed} files")
-        # print(f"Deduplication: {len(processed_hashes)} unique message+request combinations processed")
+        # Process each file (parsing time includes the nested pricing stage)
+        with instrumentation.stage("parsing"):
+            for file_path in jsonl_files:
+                entries = self._parse_jsonl_file(file_path, processed_hashes, mode)
+                all_entries.extend(entries)
         
         # Sort chronologically
-        return sorted(all_entries, key=lambda e: e.timestamp)
+        with instrumentation.stage("sorting"):
+            return sorted(all_entries, key=lambda e: e.timestamp)
 
     def _find_jsonl_files(self) -> List[Path]:
         """Find all .jsonl files in the data directory."""
@@ -107,14 +108,14 @@ class DataLoader:
         except Exception:
             pass
         
-        # Print debug info for this file (comment out for production)
-        # print(f"File: {file_path.name}")
-        # print(f"  Total lines: {total_lines}")
-        # print(f"  Valid entries: {len(entries)}")
-        # print(f"  Skipped duplicates: {skipped_duplicates}")
-        # print(f"  Skipped synthetic: {skipped_synthetic}")
-        # print(f"  Skipped invalid: {skipped_invalid}")
-        # print()
+        # Per-file counters feed the opt-in instrumentation
+        instrumentation = self.instrumentation
+        if instrumentation.enabled:
+            instrumentation.count("lines", total_lines)
+            instrumentation.count("entries", len(entries))
+            instrumentation.count("duplicates", skipped_duplicates)
+            instrumentation.count("synthetic", skipped_synthetic)
+            instrumentation.count("invalid", skipped_invalid)
         
         return entries
 
@@ -142,7 +143,7 @@ class DataLoader:
             if 'timestamp' not in data:
                 return None
             
-            timestamp = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
+            timestamp = parse_timestamp_ms(data['timestamp'])
             
             # Handle both nested and flat usage data
             usage = data.get('usage', {})
@@ -168,7 +169,15 @@ class DataLoader:
             }
             
             # Calculate cost using the new cost calculation logic
-            cost_usd = self.pricing_fetcher.calculateCostForEntry(entry_data, mode)
+            if self.instrumentation.enabled:
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                cost_usd = self.pricing_fetcher.calculateCostForEntry(entry_data, mode)
+                self.instrumentation.add_time(
+                    "pricing", time.perf_counter() - wall_start, time.process_time() - cpu_start
+                )
+            else:
+                cost_usd = self.pricing_fetcher.calculateCostForEntry(entry_data, mode)
             
             return UsageEntry(
                 timestamp=timestamp,
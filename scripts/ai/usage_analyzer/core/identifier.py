@@ -4,10 +4,10 @@ Simplified Session Block Identifier
 Core algorithm for grouping Claude usage entries into time-based session blocks.
 """
 
-from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from usage_analyzer.models.data_structures import SessionBlock, TokenCounts, UsageEntry
+from usage_analyzer.utils.timestamps import MS_PER_HOUR, isoformat_ms, now_ms
 
 
 class SessionBlockIdentifier:
@@ -16,7 +16,7 @@ class SessionBlockIdentifier:
     def __init__(self, session_duration_hours: int = 5):
         """Initialize with session duration."""
         self.session_duration_hours = session_duration_hours
-        self.session_duration = timedelta(hours=session_duration_hours)
+        self.session_duration = session_duration_hours * MS_PER_HOUR
     
     def identify_blocks(self, entries: List[UsageEntry]) -> List[SessionBlock]:
         """Process entries and create session blocks."""
@@ -67,20 +67,15 @@ class SessionBlockIdentifier:
         
         return False
     
-    def _round_to_hour(self, timestamp: datetime) -> datetime:
-        """Round timestamp to the nearest full hour in UTC."""
-        if timestamp.tzinfo is None:
-            timestamp = timestamp.replace(tzinfo=timezone.utc)
-        elif timestamp.tzinfo != timezone.utc:
-            timestamp = timestamp.astimezone(timezone.utc)
-        
-        return timestamp.replace(minute=0, second=0, microsecond=0)
+    def _round_to_hour(self, timestamp: int) -> int:
+        """Round an epoch-ms timestamp down to the full hour in UTC."""
+        return timestamp - timestamp % MS_PER_HOUR
     
     def _create_new_block(self, entry: UsageEntry) -> SessionBlock:
         """Create a new session block."""
         start_time = self._round_to_hour(entry.timestamp)
         end_time = start_time + self.session_duration
-        block_id = start_time.isoformat()
+        block_id = isoformat_ms(start_time)
 
         return SessionBlock(
             id=block_id,
@@ -146,7 +141,7 @@ class SessionBlockIdentifier:
         gap_duration = next_entry.timestamp - last_block.actual_end_time
         
         if gap_duration >= self.session_duration:
-            gap_time_str = last_block.actual_end_time.isoformat()
+            gap_time_str = isoformat_ms(last_block.actual_end_time)
             gap_id = f"gap-{gap_time_str}"
             
             return SessionBlock(
@@ -165,7 +160,7 @@ class SessionBlockIdentifier:
     
     def _mark_active_blocks(self, blocks: List[SessionBlock]):
         """Mark blocks as active if they're still ongoing."""
-        current_time = datetime.now(timezone.utc)
+        current_time = now_ms()
         
         for block in blocks:
             if not block.is_gap and block.end_time > current_time:
@@ -0,0 +1,134 @@
+"""
+Plan Limit Calibration
+
+Keeps the token totals of finalized session blocks so custom plan limits
+(historic maximum and percentiles) can be read in O(1) instead of scanning
+every block on each refresh. Totals are persisted between runs.
+"""
+
+import json
+import math
+import os
+from bisect import insort
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Fixed token limits per subscription plan
+PLAN_LIMITS = {"pro": 44000, "max5": 220000, "max20": 880000}
+
+# Auto-calibrated plans mapped to the percentile they read (None = maximum)
+CUSTOM_PLANS = {"custom_max": None, "custom_p95": 95, "custom_p99": 99}
+
+STATE_VERSION = 1
+
+
+def get_plan_limit(plan: str) -> int:
+    """Get the fixed token limit for a plan, defaulting to Pro."""
+    return PLAN_LIMITS.get(plan, PLAN_LIMITS["pro"])
+
+
+def default_state_path() -> Path:
+    """Location of the persisted limit state (under the XDG cache dir)."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or "~/.cache"
+    return Path(cache_home).expanduser() / "claude-usage" / "limits.json"
+
+
+class PlanLimitTracker:
+    """Incrementally tracks finalized block totals for custom plan limits."""
+
+    def __init__(self, state_path: Optional[str] = None):
+        """Initialize the tracker and load any persisted state."""
+        self.state_path = Path(state_path).expanduser() if state_path else default_state_path()
+        self.block_totals: Dict[str, int] = {}
+        self.sorted_totals: List[int] = []
+        self.max_tokens = 0
+        # Block ids are ISO start times, so the newest finalized id is a watermark
+        self.last_finalized_id: Optional[str] = None
+        self._load()
+
+    def update(self, blocks: List[Dict[str, Any]]) -> int:
+        """Record blocks finalized since the last update.
+
+        Blocks are walked newest-first and the walk stops at the watermark,
+        so a refresh only touches blocks that finished since the previous one.
+
+        Returns:
+            Number of newly recorded blocks
+        """
+        new_blocks = []
+        for block in reversed(blocks or []):
+            if block.get("isGap", False):
+                continue
+            block_id = block.get("id")
+            if not block_id:
+                continue
+            if self.last_finalized_id is not None and block_id <= self.last_finalized_id:
+                break
+            if block.get("isActive", False):
+                continue
+            new_blocks.append((block_id, block.get("totalTokens", 0) or 0))
+
+        for block_id, tokens in reversed(new_blocks):
+            self._record(block_id, tokens)
+
+        if new_blocks:
+            self.save()
+        return len(new_blocks)
+
+    def percentile(self, percent: float) -> int:
+        """Nearest-rank percentile of finalized block totals (0 if no history)."""
+        if not self.sorted_totals:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * len(self.sorted_totals)))
+        return self.sorted_totals[min(rank, len(self.sorted_totals)) - 1]
+
+    def get_limit(self, plan: str) -> int:
+        """Get the token limit for any plan, calibrating custom plans from history."""
+        if plan not in CUSTOM_PLANS:
+            return get_plan_limit(plan)
+
+        percent = CUSTOM_PLANS[plan]
+        limit = self.max_tokens if percent is None else self.percentile(percent)
+        return limit if limit > 0 else PLAN_LIMITS["pro"]
+
+    def save(self):
+        """Persist state atomically; failures are ignored since this is only a cache."""
+        state = {
+            "version": STATE_VERSION,
+            "lastFinalizedId": self.last_finalized_id,
+            "blocks": self.block_totals,
+        }
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            pass
+
+    def _record(self, block_id: str, tokens: int):
+        """Add a finalized block total to the running statistics."""
+        if block_id in self.block_totals:
+            return
+        self.block_totals[block_id] = tokens
+        insort(self.sorted_totals, tokens)
+        if tokens > self.max_tokens:
+            self.max_tokens = tokens
+        if self.last_finalized_id is None or block_id > self.last_finalized_id:
+            self.last_finalized_id = block_id
+
+    def _load(self):
+        """Load persisted state, starting fresh if it is missing or unreadable."""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return
+
+        for block_id, tokens in (state.get("blocks") or {}).items():
+            self._record(block_id, int(tokens))
+        self.last_finalized_id = state.get("lastFinalizedId") or self.last_finalized_id
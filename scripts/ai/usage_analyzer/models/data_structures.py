@@ -1,5 +1,4 @@
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -13,8 +12,11 @@ class CostMode(Enum):
 
 @dataclass
 class UsageEntry:
-    """Individual usage record from JSONL files."""
-    timestamp: datetime
+    """Individual usage record from JSONL files.
+
+    Times are integer epoch milliseconds (UTC); see utils.timestamps.
+    """
+    timestamp: int
     input_tokens: int
     output_tokens: int
     cache_creation_tokens: int = 0
@@ -51,11 +53,11 @@ class TokenCounts:
 
 @dataclass
 class SessionBlock:
-    """Aggregated session block for 5-hour periods."""
+    """Aggregated session block for 5-hour periods (times in epoch ms, UTC)."""
     id: str
-    start_time: datetime
-    end_time: datetime
-    actual_end_time: Optional[datetime] = None
+    start_time: int
+    end_time: int
+    actual_end_time: Optional[int] = None
     is_active: bool = False
     is_gap: bool = False
     entries: List[UsageEntry] = field(default_factory=list)
@@ -77,11 +79,11 @@ class SessionBlock:
     def duration_minutes(self) -> float:
         """Calculate block duration in minutes."""
         if self.actual_end_time:
-            delta = self.actual_end_time - self.start_time
+            delta_ms = self.actual_end_time - self.start_time
         else:
-            from datetime import timezone
-            delta = datetime.now(timezone.utc) - self.start_time
-        return delta.total_seconds() / 60
+            from usage_analyzer.utils.timestamps import now_ms
+            delta_ms = now_ms() - self.start_time
+        return delta_ms / 60000
 
 
 @dataclass
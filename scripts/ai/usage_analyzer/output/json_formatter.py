@@ -10,6 +10,7 @@ from typing import Any, Dict, List
 from usage_analyzer.models.data_structures import SessionBlock
 from usage_analyzer.core.calculator import BurnRateCalculator
 from usage_analyzer.utils.pricing_fetcher import ClaudePricingFetcher
+from usage_analyzer.utils.timestamps import format_timestamp_ms
 
 
 class JSONFormatter:
@@ -130,16 +131,7 @@ class JSONFormatter:
         return formatted_stats
 
     def _format_timestamp(self, timestamp) -> str:
-        """Format datetime to match format with milliseconds precision."""
+        """Format epoch milliseconds with milliseconds precision (.XXXZ)."""
         if timestamp is None:
             return None
-        # Convert to UTC if needed
-        if timestamp.tzinfo is not None:
-            from datetime import timezone
-            utc_timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
-        else:
-            utc_timestamp = timestamp
-        
-        # Format with milliseconds precision (.XXXZ)
-        milliseconds = utc_timestamp.microsecond // 1000
-        return utc_timestamp.strftime(f'%Y-%m-%dT%H:%M:%S.{milliseconds:03d}Z')
\ No newline at end of file
+        return format_timestamp_ms(timestamp)
\ No newline at end of file
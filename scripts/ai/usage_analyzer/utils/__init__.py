@@ -7,4 +7,7 @@ __all__ = [
     "path_discovery",
     "pricing_fetcher",
     "message_counter",
+    "instrumentation",
+    "timestamps",
+    "timezones",
 ]
\ No newline at end of file
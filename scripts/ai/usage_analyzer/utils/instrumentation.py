@@ -0,0 +1,93 @@
+"""
+Opt-in per-stage instrumentation for Claude Usage Analyzer.
+
+Records wall and CPU time for each analysis stage plus line/entry counters.
+Enabled with the CLAUDE_USAGE_PROFILE environment variable or explicitly by
+the caller; when disabled every hook is a cheap no-op.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, TextIO
+
+PROFILE_ENV_VAR = "CLAUDE_USAGE_PROFILE"
+
+
+def profiling_enabled_from_env() -> bool:
+    """Check whether instrumentation was requested through the environment."""
+    return os.getenv(PROFILE_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class Instrumentation:
+    """Collects per-stage timings and counters for one analysis run."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize with instrumentation on or off."""
+        self.enabled = enabled
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls, enabled: Optional[bool] = None) -> "Instrumentation":
+        """Create an instance, falling back to the environment when enabled is None."""
+        if enabled is None:
+            enabled = profiling_enabled_from_env()
+        return cls(enabled=enabled)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as the named stage (accumulates on reuse)."""
+        if not self.enabled:
+            yield
+            return
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def add_time(self, name: str, wall_seconds: float, cpu_seconds: float):
+        """Accumulate wall and CPU seconds for a stage."""
+        if not self.enabled:
+            return
+        stage = self.stages.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0})
+        stage["wall_ms"] += wall_seconds * 1000
+        stage["cpu_ms"] += cpu_seconds * 1000
+        stage["calls"] += 1
+
+    def count(self, name: str, amount: int = 1):
+        """Increase a named counter."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured view of the collected data."""
+        return {
+            "stages": {
+                name: {
+                    "wallMs": round(stage["wall_ms"], 3),
+                    "cpuMs": round(stage["cpu_ms"], 3),
+                    "calls": stage["calls"],
+                }
+                for name, stage in self.stages.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    def format_log_line(self) -> str:
+        """Single-line summary suitable for logs, e.g. 'parsing=12.3ms/11.9ms'."""
+        parts = [
+            f"{name}={stage['wall_ms']:.1f}ms/{stage['cpu_ms']:.1f}ms"
+            for name, stage in self.stages.items()
+        ]
+        parts.extend(f"{name}={value}" for name, value in self.counters.items())
+        return "usage_analyzer profile: " + " ".join(parts)
+
+    def emit(self, stream: Optional[TextIO] = None):
+        """Write the log line (stderr by default so stdout output stays clean)."""
+        if self.enabled:
+            print(self.format_log_line(), file=stream or sys.stderr)
@@ -0,0 +1,103 @@
+"""
+Fast timestamp handling for Claude usage data.
+
+Claude transcripts use the fixed layout YYYY-MM-DDTHH:MM:SS.mmmZ. These helpers
+parse that layout straight into integer epoch milliseconds (UTC) so all
+internal time arithmetic stays on integers; datetime objects are only built
+when a value is displayed.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+MS_PER_SECOND = 1000
+MS_PER_MINUTE = 60 * MS_PER_SECOND
+MS_PER_HOUR = 60 * MS_PER_MINUTE
+MS_PER_DAY = 24 * MS_PER_HOUR
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 'YYYY-MM-DDTHH:MM' -> epoch ms; bounded since entries arrive clustered in time
+_minute_to_ms: Dict[str, int] = {}
+_MINUTE_CACHE_LIMIT = 65536
+# epoch day number -> 'YYYY-MM-DD'
+_day_to_str: Dict[int, str] = {}
+
+
+def now_ms() -> int:
+    """Current UTC time as integer epoch milliseconds."""
+    return time.time_ns() // 1000000
+
+
+def parse_timestamp_ms(value: str) -> int:
+    """Parse an ISO-8601 timestamp into integer epoch milliseconds (UTC).
+
+    The fixed Claude layout is handled with slicing and a per-minute cache;
+    anything else falls back to datetime.fromisoformat.
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+    """
+    if len(value) == 24 and value[23] == 'Z' and value[19] == '.':
+        # 'YYYY-MM-DDTHH:MM' prefix is shared by every entry within a minute
+        minute_ms = _minute_to_ms.get(value[:16])
+        if minute_ms is None:
+            minute_ms = _parse_minute(value[:16])
+        # 'SS' + 'mmm' read as one integer is exactly the milliseconds offset
+        return minute_ms + int(value[17:19] + value[20:23])
+
+    return datetime_to_ms(datetime.fromisoformat(value.replace('Z', '+00:00')))
+
+
+def datetime_to_ms(value: datetime) -> int:
+    """Convert a datetime to epoch milliseconds (naive values are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
+
+def ms_to_datetime(value: int) -> datetime:
+    """Build an aware UTC datetime for display purposes."""
+    return EPOCH + timedelta(milliseconds=value)
+
+
+def format_timestamp_ms(value: int) -> str:
+    """Format epoch milliseconds as YYYY-MM-DDTHH:MM:SS.mmmZ."""
+    day, ms_of_day = divmod(value, MS_PER_DAY)
+    seconds, millis = divmod(ms_of_day, MS_PER_SECOND)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{_format_day(day)}T{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}Z"
+
+
+def isoformat_ms(value: int) -> str:
+    """Format epoch milliseconds exactly like datetime.isoformat() of a UTC datetime."""
+    day, ms_of_day = divmod(value, MS_PER_DAY)
+    seconds, millis = divmod(ms_of_day, MS_PER_SECOND)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    fraction = f".{millis:03d}000" if millis else ""
+    return f"{_format_day(day)}T{hours:02d}:{minutes:02d}:{seconds:02d}{fraction}+00:00"
+
+
+def _parse_minute(prefix: str) -> int:
+    """Parse and cache a 'YYYY-MM-DDTHH:MM' prefix as epoch ms (UTC)."""
+    if prefix[4] != '-' or prefix[7] != '-' or prefix[10] != 'T' or prefix[13] != ':':
+        raise ValueError(f"Invalid timestamp prefix: {prefix!r}")
+    minute = datetime(int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10]),
+                      int(prefix[11:13]), int(prefix[14:16]), tzinfo=timezone.utc)
+    minute_ms = datetime_to_ms(minute)
+    if len(_minute_to_ms) >= _MINUTE_CACHE_LIMIT:
+        _minute_to_ms.clear()
+    _minute_to_ms[prefix] = minute_ms
+    return minute_ms
+
+
+def _format_day(day_number: int) -> str:
+    """Format an epoch day number as 'YYYY-MM-DD' (cached)."""
+    day = _day_to_str.get(day_number)
+    if day is None:
+        day = (EPOCH + timedelta(days=day_number)).strftime('%Y-%m-%d')
+        _day_to_str[day_number] = day
+    return day
@@ -0,0 +1,88 @@
+"""
+Display timezone helpers for Claude usage tools.
+
+Resolves the display timezone once into a cached zoneinfo.ZoneInfo and
+converts integer UTC epoch milliseconds to local wall-clock time using a UTC
+offset cached per transition period, so refresh loops do no repeated zone
+lookups and never import pytz.
+"""
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from usage_analyzer.utils.timestamps import MS_PER_DAY, MS_PER_SECOND, ms_to_datetime
+
+DEFAULT_TIMEZONE = "Europe/Warsaw"
+
+# Offsets are probed this far around a timestamp; zones never change twice within it
+_PROBE_WINDOW_MS = MS_PER_DAY
+
+
+@lru_cache(maxsize=None)
+def resolve_timezone(name: str, fallback: str = DEFAULT_TIMEZONE) -> ZoneInfo:
+    """Resolve a timezone name once, falling back to the default on unknown names."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(fallback)
+
+
+class DisplayTimezone:
+    """Converts UTC epoch milliseconds to local time with a cached offset period."""
+
+    def __init__(self, name: str = DEFAULT_TIMEZONE):
+        """Initialize with a timezone name (unknown names use the default)."""
+        self.zone = resolve_timezone(name)
+        self.name = str(self.zone.key)
+        # [start, end) in epoch ms during which `offset_ms` applies
+        self._period: Optional[Tuple[int, int, int]] = None
+
+    def offset_ms(self, utc_ms: int) -> int:
+        """UTC offset in milliseconds at the given instant."""
+        period = self._period
+        if period is not None and period[0] <= utc_ms < period[1]:
+            return period[2]
+
+        offset = self._zone_offset(utc_ms)
+        start = self._find_boundary(utc_ms - _PROBE_WINDOW_MS, utc_ms, offset, forward=False)
+        end = self._find_boundary(utc_ms, utc_ms + _PROBE_WINDOW_MS, offset, forward=True)
+        self._period = (start, end, offset)
+        return offset
+
+    def to_local(self, utc_ms: int) -> datetime:
+        """Aware local datetime for display."""
+        offset = self.offset_ms(utc_ms)
+        local_tz = timezone(timedelta(milliseconds=offset))
+        return (ms_to_datetime(utc_ms) + timedelta(milliseconds=offset)).replace(tzinfo=local_tz)
+
+    def strftime(self, utc_ms: int, fmt: str) -> str:
+        """Format a UTC epoch-ms instant as local time."""
+        return self.to_local(utc_ms).strftime(fmt)
+
+    def _zone_offset(self, utc_ms: int) -> int:
+        """Ask zoneinfo for the offset at an instant (uncached)."""
+        offset = ms_to_datetime(utc_ms).astimezone(self.zone).utcoffset()
+        return offset // timedelta(milliseconds=1) if offset is not None else 0
+
+    def _find_boundary(self, low: int, high: int, offset: int, forward: bool) -> int:
+        """Bisect (to the second) for where the offset stops matching within [low, high].
+
+        Returns the edge of the constant-offset period on the requested side
+        (inclusive start / exclusive end, erring towards a smaller period); if
+        the offset holds across the whole probe window, the window edge is used.
+        """
+        probe = high if forward else low
+        if self._zone_offset(probe) == offset:
+            return high if forward else low
+
+        # Invariant: `inside` has the period's offset, `outside` does not
+        inside, outside = (low, high) if forward else (high, low)
+        while abs(outside - inside) > MS_PER_SECOND:
+            middle = (inside + outside) // 2
+            if self._zone_offset(middle) == offset:
+                inside = middle
+            else:
+                outside = middle
+        return inside + 1 if forward else inside
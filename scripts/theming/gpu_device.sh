@@ -0,0 +1,38 @@
+#!/usr/bin/env bash
+
+# Shared GPU Device Discovery for the gpu_*_monitor.sh scripts
+# Sourced, not executed: sets GPU_DEVICE (…/cardN/device) and GPU_HWMON (…/hwmon/hwmonN)
+# The first card exposing gpu_busy_percent is cached in the runtime dir and
+# only rediscovered when the cached path disappears (hotplug, driver reload)
+
+GPU_DRM_ROOT="${GPU_DRM_ROOT:-/sys/class/drm}"
+GPU_CACHE_FILE="${GPU_CACHE_FILE:-${XDG_RUNTIME_DIR:-/tmp}/evil-space-gpu-device}"
+
+gpu_discover() {
+    local card hwmon
+    GPU_DEVICE=""
+    GPU_HWMON=""
+    for card in "$GPU_DRM_ROOT"/card[0-9]*; do
+        # Skip connector entries such as card1-DP-1
+        [[ "${card##*/}" == *-* ]] && continue
+        if [ -r "$card/device/gpu_busy_percent" ]; then
+            GPU_DEVICE="$card/device"
+            for hwmon in "$GPU_DEVICE"/hwmon/hwmon*; do
+                [ -d "$hwmon" ] && GPU_HWMON="$hwmon" && break
+            done
+            printf '%s\n%s\n' "$GPU_DEVICE" "$GPU_HWMON" > "$GPU_CACHE_FILE" 2>/dev/null
+            return 0
+        fi
+    done
+    return 1
+}
+
+gpu_load() {
+    if [ -r "$GPU_CACHE_FILE" ]; then
+        { read -r GPU_DEVICE; read -r GPU_HWMON; } < "$GPU_CACHE_FILE"
+        [ -r "$GPU_DEVICE/gpu_busy_percent" ] && return 0
+    fi
+    gpu_discover
+}
+
+gpu_load
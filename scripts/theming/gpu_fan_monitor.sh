@@ -3,7 +3,9 @@
 # GPU Fan Speed Monitor with Dynamic Visual Indicators
 # Changes icon based on fan speed ranges
 
-pwm_raw=$(cat /sys/class/drm/card1/device/hwmon/hwmon*/pwm1 2>/dev/null | head -1)
+source "$(dirname "${BASH_SOURCE[0]}")/gpu_device.sh"
+
+pwm_raw=$(cat "$GPU_HWMON/pwm1" 2>/dev/null)
 
 if [ -z "$pwm_raw" ]; then
     echo "N/A"
@@ -3,7 +3,9 @@
 # GPU Power Monitor with Dynamic Visual Indicators
 # Changes icon based on power consumption ranges
 
-power_raw=$(cat /sys/class/drm/card1/device/hwmon/hwmon*/power1_average 2>/dev/null | head -1)
+source "$(dirname "${BASH_SOURCE[0]}")/gpu_device.sh"
+
+power_raw=$(cat "$GPU_HWMON/power1_average" 2>/dev/null)
 
 if [ -z "$power_raw" ]; then
     echo "N/A"
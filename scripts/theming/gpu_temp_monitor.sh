@@ -3,7 +3,9 @@
 # GPU Temperature Monitor with Dynamic Visual Indicators
 # Changes icon and color based on temperature ranges
 
-temp_raw=$(cat /sys/class/drm/card1/device/hwmon/hwmon*/temp1_input 2>/dev/null | head -1)
+source "$(dirname "${BASH_SOURCE[0]}")/gpu_device.sh"
+
+temp_raw=$(cat "$GPU_HWMON/temp1_input" 2>/dev/null)
 
 if [ -z "$temp_raw" ]; then
     echo "N/A"
@@ -3,7 +3,9 @@
 # GPU Usage Monitor with Dynamic Visual Indicators
 # Changes icon based on GPU utilization ranges
 
-usage=$(cat /sys/class/drm/card1/device/gpu_busy_percent 2>/dev/null)
+source "$(dirname "${BASH_SOURCE[0]}")/gpu_device.sh"
+
+usage=$(cat "$GPU_DEVICE/gpu_busy_percent" 2>/dev/null)
 
 if [ -z "$usage" ]; then
     # Fallback to radeontop if available
@@ -3,7 +3,9 @@
 # GPU VRAM Monitor with Dynamic Visual Indicators
 # Changes icon based on VRAM usage ranges
 
-vram_used=$(cat /sys/class/drm/card1/device/mem_info_vram_used 2>/dev/null)
+source "$(dirname "${BASH_SOURCE[0]}")/gpu_device.sh"
+
+vram_used=$(cat "$GPU_DEVICE/mem_info_vram_used" 2>/dev/null)
 
 if [ -z "$vram_used" ]; then
     echo "N/A"